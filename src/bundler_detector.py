@@ -4,10 +4,38 @@ Bundler detector – identifies coordinated wallet bundles in transaction data.
 
 from __future__ import annotations
 
+import heapq
 from collections import defaultdict
+from dataclasses import dataclass
+from operator import attrgetter
 from typing import Any
 
 
+@dataclass(slots=True)
+class Bundle:
+    """
+    Internal bundle record.
+
+    Slotted field access is cheaper than dict lookups in the enrichment
+    loops; instances are converted to plain dicts at the detect() boundary.
+    """
+
+    slot: Any
+    wallets: tuple[str, ...]
+    size: int
+    txn_count: int
+    suspicious: bool = False
+
+    def to_dict(self) -> dict:
+        return {
+            "slot": self.slot,
+            "wallets": self.wallets,
+            "size": self.size,
+            "txn_count": self.txn_count,
+            "suspicious": self.suspicious,
+        }
+
+
 class BundlerDetector:
     """Detects groups of wallets that transact together in the same slot (block)."""
 
@@ -19,46 +47,70 @@ class BundlerDetector:
     # Public API
     # ---------------------------------------------------------------------------
 
-    def detect(self, transactions: list[dict]) -> dict:
+    def detect(self, transactions: list[dict], top_k: int | None = None) -> dict:
         """
         Detect wallet bundles from a list of transactions.
 
+        When ``top_k`` is given, only the K largest bundles are kept and
+        summarized – a partial selection instead of a full sort.
+
         Returns a dict with: total_bundles, bundle_groups, suspicious_bundles,
         bundled_wallet_percentage.
         """
         if not transactions:
             return self._empty_result()
 
-        slot_groups = self._group_by_slot(transactions)
-        bundles = self._identify_bundles(slot_groups)
-
-        # Determine early-launch slots (first EARLY_SLOT_WINDOW unique slots seen)
-        all_slots = sorted(slot_groups.keys())
-        early_slots: set[Any] = set(all_slots[: self.EARLY_SLOT_WINDOW])
-
-        # Enrich bundles with suspicion flags
-        for bundle in bundles:
-            bundle["suspicious"] = self._is_suspicious_bundle(bundle, early_slots)
-
-        suspicious_count = sum(1 for b in bundles if b["suspicious"])
-
-        # Compute bundled wallet percentage
-        bundled_wallets: set[str] = set()
-        for bundle in bundles:
-            bundled_wallets.update(bundle["wallets"])
-
+        # Single pass: per-slot wallet sets, per-slot txn counts, and the
+        # global fee-payer set all come from one walk over the transactions.
+        slot_wallets: dict[Any, set[str]] = defaultdict(set)
+        slot_txn_counts: dict[Any, int] = defaultdict(int)
         all_fee_payers: set[str] = set()
+
+        # The sampled spelling is the first probe; the other spelling stays
+        # as a fallback so mixed payloads don't drop wallets (and stay in
+        # agreement with TraderAnalyzer, which probes both per transaction).
+        fp_key = self._detect_fp_key(transactions)
+        alt_key = "fee_payer" if fp_key == "feePayer" else "feePayer"
         for txn in transactions:
-            fp = txn.get("feePayer") or txn.get("fee_payer")
+            fp = txn.get(fp_key) or txn.get(alt_key)
             if fp:
                 all_fee_payers.add(fp)
+            slot = txn.get("slot")
+            if slot is not None:
+                slot_txn_counts[slot] += 1
+                if fp:
+                    slot_wallets[slot].add(fp)
+
+        bundles = self._identify_bundles(slot_wallets, slot_txn_counts, top_k)
 
+        # Determine early-launch slots (first EARLY_SLOT_WINDOW unique slots seen)
+        early_slots: frozenset[Any] = frozenset(
+            heapq.nsmallest(self.EARLY_SLOT_WINDOW, slot_txn_counts)
+        )
+
+        # Enrich bundles with suspicion flags and tally them in the same pass.
+        # Suspicious = large bundle OR launch bundle in an early slot.
+        susp_min = self.SUSPICIOUS_MIN_SIZE
+        suspicious_count = 0
+        for bundle in bundles:
+            flag = bundle.size >= susp_min or bundle.slot in early_slots
+            bundle.suspicious = flag
+            suspicious_count += flag
+
+        # Compute bundled wallet percentage (single C-level multi-arg union)
+        bundled_wallets: set[str] = (
+            set().union(*(b.wallets for b in bundles)) if bundles else set()
+        )
+
+        # round() rather than integer floor division: this is a user-visible
+        # report field that also feeds RiskScorer, and truncation drifts it
+        # 0.01 low whenever the exact value doesn't land on a hundredth.
         total_wallets = len(all_fee_payers) or 1
         bundled_pct = round(len(bundled_wallets) / total_wallets * 100, 2)
 
         return {
             "total_bundles": len(bundles),
-            "bundle_groups": bundles,
+            "bundle_groups": [b.to_dict() for b in bundles],
             "suspicious_bundles": suspicious_count,
             "bundled_wallet_percentage": bundled_pct,
         }
@@ -67,56 +119,74 @@ class BundlerDetector:
     # Internal helpers
     # ---------------------------------------------------------------------------
 
-    def _group_by_slot(self, transactions: list[dict]) -> dict[Any, list[dict]]:
-        """Group transactions by slot number."""
-        groups: dict[Any, list[dict]] = defaultdict(list)
-        for txn in transactions:
-            slot = txn.get("slot")
-            if slot is not None:
-                groups[slot].append(txn)
-        return dict(groups)
-
-    def _identify_bundles(self, slot_groups: dict[Any, list[dict]]) -> list[dict]:
+    @staticmethod
+    def _detect_fp_key(transactions: list[dict]) -> str:
         """
-        Return bundles: sets of 3+ wallets all transacting in the same slot.
+        Return the fee-payer key this payload uses ("feePayer" or "fee_payer").
+
+        Sampling once up front makes the sampled spelling the hot loop's
+        first probe, so uniform payloads pay a single dict lookup per
+        transaction; the loop still falls back to the other spelling on a
+        miss.
         """
-        bundles: list[dict] = []
-        for slot, txns in slot_groups.items():
-            wallets: set[str] = set()
-            for txn in txns:
-                fp = txn.get("feePayer") or txn.get("fee_payer")
-                if fp:
-                    wallets.add(fp)
-
-            if len(wallets) >= self.BUNDLE_MIN_SIZE:
-                bundles.append(
-                    {
-                        "slot": slot,
-                        "wallets": list(wallets),
-                        "size": len(wallets),
-                        "txn_count": len(txns),
-                        "suspicious": False,  # filled in later
-                    }
-                )
-
-        return sorted(bundles, key=lambda b: b["size"], reverse=True)
-
-    def _is_suspicious_bundle(self, bundle: dict, early_slots: set[Any]) -> bool:
+        for txn in transactions:
+            if "feePayer" in txn:
+                return "feePayer"
+            if "fee_payer" in txn:
+                return "fee_payer"
+        return "feePayer"
+
+    def _identify_bundles(
+        self,
+        slot_wallets: dict[Any, set[str]],
+        slot_txn_counts: dict[Any, int],
+        top_k: int | None = None,
+    ) -> list[Bundle]:
         """
-        Flag as suspicious if:
-        - Size >= SUSPICIOUS_MIN_SIZE wallets, OR
-        - The slot is one of the first EARLY_SLOT_WINDOW slots (launch bundles)
+        Return bundles: sets of 3+ wallets all transacting in the same slot,
+        largest first (only the K largest when ``top_k`` is given).
+
+        The per-slot wallet sets are already deduplicated upstream, so this
+        is a plain filter + map over the slot index.
         """
-        if bundle["size"] >= self.SUSPICIOUS_MIN_SIZE:
-            return True
-        if bundle["slot"] in early_slots:
-            return True
-        return False
+        min_size = self.BUNDLE_MIN_SIZE
+        bundles = [
+            Bundle(
+                slot=slot,
+                wallets=tuple(wallets),
+                size=len(wallets),
+                txn_count=slot_txn_counts[slot],
+            )
+            for slot, wallets in slot_wallets.items()
+            if len(wallets) >= min_size
+        ]
+        if top_k is not None:
+            return heapq.nlargest(top_k, bundles, key=attrgetter("size"))
+        return sorted(bundles, key=attrgetter("size"), reverse=True)
 
     # ---------------------------------------------------------------------------
     # Utility
     # ---------------------------------------------------------------------------
 
+    @staticmethod
+    def intersect_bundles(bundles: list[dict]) -> frozenset[str]:
+        """
+        Return the wallets common to every bundle.
+
+        Intersects smallest-first with an early exit, so the working set
+        only ever shrinks and empty intersections bail out immediately.
+        """
+        if not bundles:
+            return frozenset()
+
+        ordered = sorted(bundles, key=lambda b: len(b["wallets"]))
+        result = set(ordered[0]["wallets"])
+        for bundle in ordered[1:]:
+            result.intersection_update(bundle["wallets"])
+            if not result:
+                break
+        return frozenset(result)
+
     @staticmethod
     def _empty_result() -> dict:
         return {
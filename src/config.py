@@ -5,18 +5,30 @@ Loads API keys and settings from .env file.
 
 import os
 import warnings
+from functools import cache
 from pathlib import Path
 from dotenv import load_dotenv
 
-# Load .env file from project root
 _project_root = Path(__file__).parent.parent
-load_dotenv(_project_root / ".env")
+
+# Set once the .env file has been parsed; importing this module stays free
+# of filesystem work, but every Config construction after the first reuses
+# the already-populated environment.
+_env_loaded = False
 
 
 class Config:
     """Centralised configuration loaded from environment variables."""
 
     def __init__(self):
+        # load_dotenv never overrides variables the shell already set, so
+        # loading unconditionally (once) is safe even when some keys come
+        # from the environment and the rest from .env.
+        global _env_loaded
+        if not _env_loaded:
+            load_dotenv(_project_root / ".env")
+            _env_loaded = True
+
         self.helius_api_key: str = self._require("HELIUS_API_KEY")
         self.rugcheck_api_key: str | None = self._optional("RUGCHECK_API_KEY")
         self.output_dir: str = os.getenv("OUTPUT_DIR", "./output")
@@ -48,6 +60,16 @@ class Config:
 
 
 # Module-level convenience accessors (populated lazily so imports don't fail)
+@cache
 def get_config() -> Config:
-    """Return a Config instance, raising EnvironmentError if required keys are missing."""
+    """
+    Return the process-wide Config instance, raising EnvironmentError if
+    required keys are missing. Construction (env reads, mkdir, warnings)
+    happens exactly once per process.
+    """
     return Config()
+
+
+def reset_config() -> None:
+    """Drop the cached Config so the next get_config() rebuilds it (for tests)."""
+    get_config.cache_clear()
@@ -5,10 +5,14 @@ All methods return empty dicts/lists on failure; they never raise to the caller.
 
 from __future__ import annotations
 
-import time
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # ---------------------------------------------------------------------------
 # Internal helpers
@@ -21,75 +25,37 @@ _RUGCHECK_API = "https://api.rugcheck.xyz/v1"
 _DEFAULT_TIMEOUT = 20  # seconds
 _MAX_RETRIES = 2
 
+try:  # optional C-accelerated JSON parser
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
 
-def _try_import_rich():
-    try:
-        from rich import print as rprint  # noqa: F401
-        return rprint
-    except ImportError:
-        return print
 
+# Rich re-parses markup on every emit, which is wasted work on the frequent
+# warning paths; it is opt-in via TOKEN_GUARDIAN_RICH=1. The default strips
+# the markup tags with one compiled regex and goes straight to print.
+_MARKUP_RE = re.compile(r"\[/?[^\]]*\]")
 
-_print = _try_import_rich()
 
+def _plain_print(msg, *args, **kwargs):
+    if isinstance(msg, str):
+        msg = _MARKUP_RE.sub("", msg)
+    print(msg, *args, **kwargs)
 
-def _post_with_retry(url: str, payload: dict, timeout: int = _DEFAULT_TIMEOUT) -> dict:
-    """POST JSON with retry logic. Returns parsed JSON or empty dict."""
-    last_exc: Exception | None = None
-    for attempt in range(_MAX_RETRIES + 1):
-        try:
-            resp = requests.post(url, json=payload, timeout=timeout)
-            resp.raise_for_status()
-            return resp.json()
-        except requests.exceptions.Timeout as exc:
-            last_exc = exc
-            _print(f"[yellow]⚠ Timeout on attempt {attempt + 1}/{_MAX_RETRIES + 1} for {url}[/yellow]")
-        except requests.exceptions.HTTPError as exc:
-            # Don't retry 4xx client errors
-            if exc.response is not None and 400 <= exc.response.status_code < 500:
-                _print(f"[red]✗ HTTP {exc.response.status_code} for {url}[/red]")
-                return {}
-            last_exc = exc
-            _print(f"[yellow]⚠ HTTP error on attempt {attempt + 1}: {exc}[/yellow]")
-        except requests.exceptions.RequestException as exc:
-            last_exc = exc
-            _print(f"[yellow]⚠ Request error on attempt {attempt + 1}: {exc}[/yellow]")
-
-        if attempt < _MAX_RETRIES:
-            time.sleep(1.5 ** attempt)
-
-    _print(f"[red]✗ All retries exhausted for {url}: {last_exc}[/red]")
-    return {}
 
-
-def _get_with_retry(url: str, params: dict | None = None, timeout: int = _DEFAULT_TIMEOUT) -> dict | list:
-    """GET with retry logic. Returns parsed JSON or empty dict."""
-    last_exc: Exception | None = None
-    for attempt in range(_MAX_RETRIES + 1):
+def _resolve_print():
+    if os.getenv("TOKEN_GUARDIAN_RICH") == "1":
         try:
-            resp = requests.get(url, params=params, timeout=timeout)
-            if resp.status_code == 404:
-                return {}
-            resp.raise_for_status()
-            return resp.json()
-        except requests.exceptions.Timeout as exc:
-            last_exc = exc
-            _print(f"[yellow]⚠ Timeout on attempt {attempt + 1}/{_MAX_RETRIES + 1} for {url}[/yellow]")
-        except requests.exceptions.HTTPError as exc:
-            if exc.response is not None and 400 <= exc.response.status_code < 500:
-                _print(f"[red]✗ HTTP {exc.response.status_code} for {url}[/red]")
-                return {}
-            last_exc = exc
-            _print(f"[yellow]⚠ HTTP error on attempt {attempt + 1}: {exc}[/yellow]")
-        except requests.exceptions.RequestException as exc:
-            last_exc = exc
-            _print(f"[yellow]⚠ Request error on attempt {attempt + 1}: {exc}[/yellow]")
+            from rich import print as rprint
+            return rprint
+        except ImportError:
+            pass
+    return _plain_print
 
-        if attempt < _MAX_RETRIES:
-            time.sleep(1.5 ** attempt)
 
-    _print(f"[red]✗ All retries exhausted for {url}: {last_exc}[/red]")
-    return {}
+_print = _resolve_print()
 
 
 # ---------------------------------------------------------------------------
@@ -103,6 +69,67 @@ class DataFetcher:
         self.helius_api_key = helius_api_key
         self.rugcheck_api_key = rugcheck_api_key
 
+        # One pooled session per fetcher: keep-alive amortizes the TCP + TLS
+        # handshake across the many calls a single analysis run makes.
+        # Retries with exponential backoff run inside urllib3, which also
+        # keeps the connection alive across attempts.
+        retry = Retry(
+            total=_MAX_RETRIES,
+            backoff_factor=1.5,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset({"GET", "POST"}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+        self._session = requests.Session()
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._session.headers.update({"User-Agent": "token-guardian/1"})
+
+        # Per-run memoization: token metadata, supply, and RugCheck reports
+        # are effectively constant for the lifetime of a fetcher, so repeat
+        # calls for the same mint skip the network round-trip entirely.
+        # Only successful responses are cached – failures stay retryable.
+        self._token_info_cache: dict[str, dict] = {}
+        self._token_supply_cache: dict[str, dict] = {}
+        self._rugcheck_cache: dict[str, dict] = {}
+
+    # ------------------------------------------------------------------
+    # HTTP helpers
+    # ------------------------------------------------------------------
+
+    def _post(self, url: str, payload: dict | list, timeout: int = _DEFAULT_TIMEOUT) -> dict | list:
+        """POST JSON. Retries and backoff are handled by the mounted adapter."""
+        try:
+            resp = self._session.post(url, json=payload, timeout=timeout)
+            resp.raise_for_status()
+            return _loads(resp.content)
+        except requests.exceptions.HTTPError as exc:
+            status = exc.response.status_code if exc.response is not None else "?"
+            _print(f"[red]✗ HTTP {status} for {url}[/red]")
+            return {}
+        # Decode failures from _loads are ValueError, not RequestException;
+        # both must stay inside the never-raise contract of this module.
+        except (requests.exceptions.RequestException, ValueError) as exc:
+            _print(f"[red]✗ Request failed for {url}: {exc}[/red]")
+            return {}
+
+    def _get(self, url: str, params: dict | None = None, timeout: int = _DEFAULT_TIMEOUT) -> dict | list:
+        """GET JSON. Retries and backoff are handled by the mounted adapter."""
+        try:
+            resp = self._session.get(url, params=params, timeout=timeout)
+            if resp.status_code == 404:
+                return {}
+            resp.raise_for_status()
+            return _loads(resp.content)
+        except requests.exceptions.HTTPError as exc:
+            status = exc.response.status_code if exc.response is not None else "?"
+            _print(f"[red]✗ HTTP {status} for {url}[/red]")
+            return {}
+        except (requests.exceptions.RequestException, ValueError) as exc:
+            _print(f"[red]✗ Request failed for {url}: {exc}[/red]")
+            return {}
+
     # ------------------------------------------------------------------
     # Helius helpers
     # ------------------------------------------------------------------
@@ -112,19 +139,40 @@ class DataFetcher:
 
     def _helius_rpc(self, method: str, params: Any) -> dict:
         payload = {"jsonrpc": "2.0", "id": "1", "method": method, "params": params}
-        return _post_with_retry(self._helius_rpc_url(), payload)
+        return self._post(self._helius_rpc_url(), payload)
+
+    def _helius_rpc_batch(self, calls: list[tuple[str, Any]]) -> list[dict]:
+        """
+        POST several RPC calls as one JSON-RPC batch (single round-trip).
+
+        Returns one response dict per call, in call order; failed or missing
+        entries come back as empty dicts.
+        """
+        batch = [
+            {"jsonrpc": "2.0", "id": str(i), "method": method, "params": params}
+            for i, (method, params) in enumerate(calls)
+        ]
+        data = self._post(self._helius_rpc_url(), batch)
+        if not isinstance(data, list):
+            return [{} for _ in calls]
+        by_id = {item.get("id"): item for item in data if isinstance(item, dict)}
+        return [by_id.get(str(i), {}) for i in range(len(calls))]
 
     # ------------------------------------------------------------------
     # Public API methods
     # ------------------------------------------------------------------
 
     def get_token_info(self, token_address: str) -> dict:
-        """Fetch token metadata via Helius getAsset."""
-        data = _post_with_retry(
-            self._helius_rpc_url(),
-            {"jsonrpc": "2.0", "id": "1", "method": "getAsset", "params": {"id": token_address}},
-        )
-        result = data.get("result", {})
+        """Fetch token metadata via Helius getAsset. Memoized per address."""
+        cached = self._token_info_cache.get(token_address)
+        if cached is not None:
+            return cached
+
+        data = self._helius_rpc("getAsset", {"id": token_address})
+        return self._parse_token_info(data.get("result") or {}, token_address)
+
+    def _parse_token_info(self, result: dict, token_address: str) -> dict:
+        """Extract token-info fields from a getAsset result payload."""
         if not result:
             return {}
 
@@ -135,10 +183,10 @@ class DataFetcher:
         decimals = token_info.get("decimals", 0)
 
         mint_authority = result.get("authorities", [])
-        has_mint = any(a.get("scopes", []) and "mint" in a.get("scopes", []) for a in mint_authority)
+        has_mint = any("mint" in (a.get("scopes") or ()) for a in mint_authority)
         has_freeze = token_info.get("freeze_authority") is not None
 
-        return {
+        info = self._token_info_cache[token_address] = {
             "address": token_address,
             "name": metadata.get("name", "Unknown"),
             "symbol": metadata.get("symbol", "???"),
@@ -150,39 +198,65 @@ class DataFetcher:
             "image": content.get("links", {}).get("image", ""),
             "raw": result,
         }
+        return info
 
     def get_token_largest_accounts(self, token_address: str) -> list[dict]:
         """Return top holders with address, amount, and percentage."""
-        supply_data = self.get_token_supply(token_address)
-        total_supply_ui = supply_data.get("uiAmount", 0) if supply_data else 0
+        # Supply and largest-accounts calls are independent – overlap them.
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            supply_future = ex.submit(self.get_token_supply, token_address)
+            data = self._helius_rpc("getTokenLargestAccounts", [token_address])
+            supply_data = supply_future.result()
 
-        data = self._helius_rpc("getTokenLargestAccounts", [token_address])
+        total_supply_ui = supply_data.get("uiAmount", 0) if supply_data else 0
         accounts = data.get("result", {}).get("value", [])
+        return self._parse_largest_accounts(accounts, total_supply_ui)
+
+    @staticmethod
+    def _parse_largest_accounts(accounts: list[dict], total_supply_ui: float) -> list[dict]:
+        """
+        Turn raw getTokenLargestAccounts values into holder dicts.
+
+        Helius already returns accounts sorted by amount descending, so no
+        re-sort is needed here.
+        """
+        _float, _round = float, round
+        inv_supply = (100.0 / total_supply_ui) if total_supply_ui else 0.0
 
         holders: list[dict] = []
+        append = holders.append
         for acct in accounts:
-            ui_amount = float(acct.get("uiAmountString") or acct.get("uiAmount") or 0)
-            pct = (ui_amount / total_supply_ui * 100) if total_supply_ui else 0
-            holders.append(
+            ui_amount = _float(acct.get("uiAmountString") or acct.get("uiAmount") or 0)
+            append(
                 {
                     "address": acct.get("address", ""),
                     "amount": ui_amount,
-                    "percentage": round(pct, 4),
+                    "percentage": _round(ui_amount * inv_supply, 4),
                 }
             )
 
-        return sorted(holders, key=lambda h: h["amount"], reverse=True)
+        return holders
 
     def get_token_supply(self, token_address: str) -> dict:
-        """Get token supply information."""
+        """Get token supply information. Memoized per address."""
+        cached = self._token_supply_cache.get(token_address)
+        if cached is not None:
+            return cached
+
         data = self._helius_rpc("getTokenSupply", [token_address])
-        value = data.get("result", {}).get("value", {})
-        return {
+        return self._parse_token_supply(data.get("result", {}).get("value", {}), token_address)
+
+    def _parse_token_supply(self, value: dict, token_address: str) -> dict:
+        """Extract supply fields from a getTokenSupply result value."""
+        supply = {
             "amount": value.get("amount", "0"),
             "decimals": value.get("decimals", 0),
             "uiAmount": value.get("uiAmount", 0),
             "uiAmountString": value.get("uiAmountString", "0"),
         }
+        if value:
+            self._token_supply_cache[token_address] = supply
+        return supply
 
     def get_recent_transactions(self, token_address: str, limit: int = 100) -> list[dict]:
         """Get recent SWAP transactions via Helius Enhanced Transactions API."""
@@ -192,47 +266,63 @@ class DataFetcher:
             "limit": min(limit, 100),
             "type": "SWAP",
         }
-        result = _get_with_retry(url, params=params)
+        result = self._get(url, params=params)
         if isinstance(result, list):
             return result
         return []
 
     def get_rugcheck_report(self, token_address: str) -> dict:
-        """Fetch rug pull analysis from RugCheck.xyz."""
+        """Fetch rug pull analysis from RugCheck.xyz. Memoized per address."""
+        cached = self._rugcheck_cache.get(token_address)
+        if cached is not None:
+            return cached
+
         url = f"{_RUGCHECK_API}/tokens/{token_address}/report"
         headers: dict[str, str] = {}
         if self.rugcheck_api_key:
             headers["Authorization"] = f"Bearer {self.rugcheck_api_key}"
 
         try:
-            resp = requests.get(url, headers=headers, timeout=_DEFAULT_TIMEOUT)
+            resp = self._session.get(url, headers=headers, timeout=_DEFAULT_TIMEOUT)
             if resp.status_code == 404:
                 _print(f"[yellow]⚠ RugCheck: no report found for {token_address}[/yellow]")
                 return {}
             resp.raise_for_status()
-            return resp.json()
-        except requests.exceptions.RequestException as exc:
+            report = self._rugcheck_cache[token_address] = _loads(resp.content)
+            return report
+        except (requests.exceptions.RequestException, ValueError) as exc:
             _print(f"[yellow]⚠ RugCheck unavailable: {exc}[/yellow]")
             return {}
 
     def get_all_token_data(self, token_address: str) -> dict:
-        """Fetch all available data for a token and combine into one dict."""
-        _print(f"[cyan]→ Fetching token metadata...[/cyan]")
-        token_info = self.get_token_info(token_address)
-
-        _print(f"[cyan]→ Fetching top holders...[/cyan]")
-        holders = self.get_token_largest_accounts(token_address)
-
-        _print(f"[cyan]→ Fetching recent transactions...[/cyan]")
-        transactions = self.get_recent_transactions(token_address)
-
-        _print(f"[cyan]→ Fetching RugCheck report...[/cyan]")
-        rugcheck = self.get_rugcheck_report(token_address)
+        """Fetch all available data for a token concurrently and combine into one dict."""
+        _print(f"[cyan]→ Fetching metadata, holders, transactions, and RugCheck report...[/cyan]")
+
+        # The three Helius RPC calls collapse into one batched POST (a single
+        # round-trip); the two remaining GETs run concurrently alongside it.
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            transactions_future = ex.submit(self.get_recent_transactions, token_address)
+            rugcheck_future = ex.submit(self.get_rugcheck_report, token_address)
+
+            asset_resp, supply_resp, largest_resp = self._helius_rpc_batch(
+                [
+                    ("getAsset", {"id": token_address}),
+                    ("getTokenSupply", [token_address]),
+                    ("getTokenLargestAccounts", [token_address]),
+                ]
+            )
+            token_info = self._parse_token_info(asset_resp.get("result") or {}, token_address)
+            supply = self._parse_token_supply(
+                supply_resp.get("result", {}).get("value", {}), token_address
+            )
+            holders = self._parse_largest_accounts(
+                largest_resp.get("result", {}).get("value", []), supply.get("uiAmount", 0)
+            )
 
-        return {
-            "token_address": token_address,
-            "token_info": token_info,
-            "holders": holders,
-            "transactions": transactions,
-            "rugcheck": rugcheck,
-        }
+            return {
+                "token_address": token_address,
+                "token_info": token_info,
+                "holders": holders,
+                "transactions": transactions_future.result(),
+                "rugcheck": rugcheck_future.result(),
+            }
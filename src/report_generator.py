@@ -6,10 +6,131 @@ from __future__ import annotations
 
 import base64
 import json
-import os
+import mmap
+import string
+from concurrent.futures import ThreadPoolExecutor
+from html import escape
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:  # optional C-accelerated JSON serializer
+    import orjson
+except ImportError:
+    orjson = None
+
+try:  # optional terminal dashboard dependency, resolved once at import
+    from rich import box
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.table import Table
+    _RICH = True
+except ImportError:
+    _RICH = False
+
+# Compiled once at import; generate_html_report only substitutes the handful
+# of values that actually vary per report instead of re-parsing the whole
+# CSS/markup skeleton on every call.
+_HTML_TEMPLATE = string.Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0">
+  <title>Token Guardian – ${token_symbol} (${token_address_short}…)</title>
+  <style>
+    * { box-sizing: border-box; margin: 0; padding: 0; }
+    body {
+      font-family: 'Segoe UI', system-ui, sans-serif;
+      background: #1e1e2e; color: #cdd6f4; min-height: 100vh; padding: 24px;
+    }
+    header { border-bottom: 2px solid #313244; padding-bottom: 16px; margin-bottom: 24px; }
+    header h1 { font-size: 1.8rem; }
+    header p { color: #a6adc8; font-size: 0.9rem; margin-top: 4px; }
+    .badge {
+      display: inline-block; padding: 4px 12px; border-radius: 20px;
+      font-weight: 700; font-size: 1rem; color: #1e1e2e;
+      background: ${risk_color};
+    }
+    .score-card {
+      background: #313244; border-radius: 10px; padding: 20px; margin-bottom: 24px;
+      display: flex; align-items: center; gap: 20px;
+    }
+    .score-number { font-size: 3rem; font-weight: 900; color: ${risk_color}; }
+    .info-grid {
+      display: grid; grid-template-columns: repeat(auto-fill, minmax(200px, 1fr));
+      gap: 12px; margin-bottom: 24px;
+    }
+    .info-card {
+      background: #313244; border-radius: 8px; padding: 14px;
+    }
+    .info-card .label { color: #a6adc8; font-size: 0.75rem; text-transform: uppercase; }
+    .info-card .value { font-size: 1.1rem; font-weight: 600; margin-top: 4px; }
+    table { width: 100%; border-collapse: collapse; margin-bottom: 24px; }
+    th, td { padding: 10px 12px; text-align: left; border-bottom: 1px solid #313244; }
+    th { color: #89b4fa; font-size: 0.8rem; text-transform: uppercase; }
+    tr:hover td { background: #2a2a3d; }
+    h2 { color: #89b4fa; margin: 24px 0 12px; font-size: 1.1rem; text-transform: uppercase; letter-spacing: 1px; }
+    .charts { display: flex; flex-wrap: wrap; gap: 16px; }
+    .chart-card {
+      background: #313244; border-radius: 10px; padding: 14px; flex: 1 1 420px;
+    }
+    .chart-card h3 { color: #a6adc8; font-size: 0.85rem; margin-bottom: 8px; }
+    .chart-card img { width: 100%; border-radius: 6px; }
+    footer { color: #585b70; font-size: 0.8rem; margin-top: 32px; text-align: center; }
+  </style>
+</head>
+<body>
+  <header>
+    <h1>🛡 Token Guardian Report &nbsp;<span class="badge">${risk_level}</span></h1>
+    <p>Token: <strong>${token_name}</strong> (${token_symbol}) · Address: ${token_address}</p>
+    <p>Generated: ${generated_at}</p>
+  </header>
+
+  <div class="score-card">
+    <div class="score-number">${total_score}</div>
+    <div>
+      <div style="font-size:1.4rem;font-weight:700">Risk Score <span class="badge">${risk_level}</span></div>
+      <div style="color:#a6adc8;margin-top:4px">0 = safe · 100 = critical</div>
+    </div>
+  </div>
+
+  <div class="info-grid">
+    ${info_cards}
+  </div>
+
+  <h2>⚠ Triggered Risk Factors</h2>
+  ${factors_section}
+
+  <h2>📊 Charts</h2>
+  <div class="charts">
+    ${charts_section}
+  </div>
+
+  <footer>Solana Token Guardian Agent · Report generated at ${generated_iso}</footer>
+</body>
+</html>""")
+
+
+
+def _encode_chart_b64(path: str) -> str | None:
+    """
+    Read one chart file and return its base64 payload, or None if the
+    file is missing or unreadable.
+
+    Memory-mapping hands b64encode a buffer straight from the page cache,
+    skipping the intermediate bytes object a plain read() would allocate;
+    ascii decoding skips UTF-8 validation of the base64 output. Handling
+    OSError here instead of pre-checking existence avoids a stat per
+    chart and the race between check and open.
+    """
+    try:
+        with open(path, "rb") as fh:
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return base64.b64encode(mm).decode("ascii")
+    # mmap raises ValueError for a zero-byte file (e.g. an interrupted
+    # savefig); treat it like any other unreadable chart.
+    except (OSError, ValueError):
+        return None
+
 
 class ReportGenerator:
     """Generates analysis reports in multiple formats."""
@@ -32,24 +153,36 @@ class ReportGenerator:
         chart_paths: list[str],
     ) -> str:
         """Write a JSON report and return the file path."""
+        now = datetime.now(tz=timezone.utc)
         report = {
-            "generated_at": datetime.now(tz=timezone.utc).isoformat(),
+            "generated_at": now.isoformat(),
             "token_address": token_address,
             "token_info": token_info,
             "risk": risk_result,
             "trader_analysis": {
-                k: v for k, v in trader_analysis.items() if k != "trader_details"
+                k: v
+                for k, v in trader_analysis.items()
+                if k not in ("trader_details", "trader_details_by_wallet")
             },
             "bundle_analysis": {
                 k: v for k, v in bundle_analysis.items() if k != "bundle_groups"
             },
-            "bundle_groups_preview": bundle_analysis.get("bundle_groups", [])[:5],
+            "bundle_groups_preview": [
+                {**g, "wallets": sorted(g["wallets"])}
+                for g in bundle_analysis.get("bundle_groups", [])[:5]
+            ],
             "chart_files": chart_paths,
         }
 
-        filename = f"report_{token_address[:8]}_{self._ts()}.json"
+        filename = f"report_{token_address[:8]}_{self._ts(now)}.json"
         out_path = self.output_dir / filename
-        out_path.write_text(json.dumps(report, indent=2, default=str), encoding="utf-8")
+        if orjson is not None:
+            out_path.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2, default=str))
+        else:
+            # Stream the serializer straight into the file – ensure_ascii
+            # output needs no transcoding pass over a large intermediate str.
+            with out_path.open("w", encoding="utf-8") as fh:
+                json.dump(report, fh, indent=2, default=str)
         return str(out_path)
 
     # ------------------------------------------------------------------
@@ -66,18 +199,24 @@ class ReportGenerator:
         chart_paths: list[str],
     ) -> str:
         """Generate a self-contained dark-theme HTML report and return the file path."""
-        charts_html = ""
-        for path in chart_paths:
-            if os.path.exists(path):
-                with open(path, "rb") as fh:
-                    b64 = base64.b64encode(fh.read()).decode()
+        # Issue all chart reads at once and overlap them with the base64
+        # encoding, instead of paying each file's read latency serially.
+        # Missing or unreadable charts come back as None and are skipped.
+        charts_parts: list[str] = []
+        if chart_paths:
+            with ThreadPoolExecutor(max_workers=min(4, len(chart_paths))) as ex:
+                encoded = list(ex.map(_encode_chart_b64, chart_paths))
+            for path, b64 in zip(chart_paths, encoded):
+                if b64 is None:
+                    continue
                 label = Path(path).stem.replace("_", " ").title()
-                charts_html += (
+                charts_parts.append(
                     f'<div class="chart-card">'
                     f'<h3>{label}</h3>'
                     f'<img src="data:image/png;base64,{b64}" alt="{label}">'
                     f"</div>\n"
                 )
+        charts_html = "".join(charts_parts)
 
         risk_level = risk_result.get("risk_level", "UNKNOWN")
         risk_color = {
@@ -87,138 +226,86 @@ class ReportGenerator:
             "CRITICAL": "#B71C1C",
         }.get(risk_level, "#888")
 
-        factors_rows = ""
-        for f in risk_result.get("factors", []):
-            factors_rows += (
-                f"<tr><td>{f['name']}</td>"
-                f"<td style='color:#ff6b6b'>+{f['points']}</td>"
-                f"<td>{f['description']}</td></tr>\n"
+        factors_rows = "".join(
+            f"<tr><td>{f['name']}</td>"
+            f"<td style='color:#ff6b6b'>+{f['points']}</td>"
+            f"<td>{f['description']}</td></tr>\n"
+            for f in risk_result.get("factors", [])
+        )
+        if factors_rows:
+            factors_section = (
+                "<table><thead><tr><th>Factor</th><th>Points</th>"
+                "<th>Description</th></tr></thead><tbody>"
+                + factors_rows
+                + "</tbody></table>"
             )
+        else:
+            factors_section = '<p style="color:#a6adc8">No risk factors triggered.</p>'
+
+        mint_revoked = risk_result.get("mint_authority_revoked")
+        freeze_revoked = risk_result.get("freeze_authority_revoked")
+        liquidity = risk_result.get("liquidity_locked")
+
+        # Info cards as (label, value, color) data; one join builds the grid.
+        cards = [
+            (
+                "Mint Authority",
+                "✓ Revoked" if mint_revoked else "✗ NOT Revoked",
+                "#4CAF50" if mint_revoked else "#F44336",
+            ),
+            (
+                "Freeze Authority",
+                "✓ Revoked" if freeze_revoked else "✗ NOT Revoked",
+                "#4CAF50" if freeze_revoked else "#F44336",
+            ),
+            ("Top-10 Concentration", f"{risk_result.get('top10_concentration', 0):.1f}%", None),
+            ("Bot Activity", f"{risk_result.get('bot_percentage', 0):.1f}%", None),
+            ("Bundled Wallets", f"{risk_result.get('bundled_wallet_percentage', 0):.1f}%", None),
+            (
+                "Liquidity Info",
+                "✓ Found" if liquidity else "✗ Not Found",
+                "#4CAF50" if liquidity else "#F44336",
+            ),
+            ("Total Wallets Analysed", trader_analysis.get("total_wallets", 0), None),
+            (
+                "Bundles Detected",
+                f"{bundle_analysis.get('total_bundles', 0)}"
+                f" ({bundle_analysis.get('suspicious_bundles', 0)} suspicious)",
+                None,
+            ),
+        ]
+        info_cards = "".join(
+            '<div class="info-card"><div class="label">{}</div>'
+            '<div class="value"{}>{}</div></div>\n'.format(
+                label, f' style="color:{color}"' if color else "", value
+            )
+            for label, value, color in cards
+        )
 
-        token_name = token_info.get("name", "Unknown")
-        token_symbol = token_info.get("symbol", "???")
-        total_score = risk_result.get("total_score", 0)
-
-        html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-  <meta charset="UTF-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>Token Guardian – {token_symbol} ({token_address[:8]}…)</title>
-  <style>
-    * {{ box-sizing: border-box; margin: 0; padding: 0; }}
-    body {{
-      font-family: 'Segoe UI', system-ui, sans-serif;
-      background: #1e1e2e; color: #cdd6f4; min-height: 100vh; padding: 24px;
-    }}
-    header {{ border-bottom: 2px solid #313244; padding-bottom: 16px; margin-bottom: 24px; }}
-    header h1 {{ font-size: 1.8rem; }}
-    header p {{ color: #a6adc8; font-size: 0.9rem; margin-top: 4px; }}
-    .badge {{
-      display: inline-block; padding: 4px 12px; border-radius: 20px;
-      font-weight: 700; font-size: 1rem; color: #1e1e2e;
-      background: {risk_color};
-    }}
-    .score-card {{
-      background: #313244; border-radius: 10px; padding: 20px; margin-bottom: 24px;
-      display: flex; align-items: center; gap: 20px;
-    }}
-    .score-number {{ font-size: 3rem; font-weight: 900; color: {risk_color}; }}
-    .info-grid {{
-      display: grid; grid-template-columns: repeat(auto-fill, minmax(200px, 1fr));
-      gap: 12px; margin-bottom: 24px;
-    }}
-    .info-card {{
-      background: #313244; border-radius: 8px; padding: 14px;
-    }}
-    .info-card .label {{ color: #a6adc8; font-size: 0.75rem; text-transform: uppercase; }}
-    .info-card .value {{ font-size: 1.1rem; font-weight: 600; margin-top: 4px; }}
-    table {{ width: 100%; border-collapse: collapse; margin-bottom: 24px; }}
-    th, td {{ padding: 10px 12px; text-align: left; border-bottom: 1px solid #313244; }}
-    th {{ color: #89b4fa; font-size: 0.8rem; text-transform: uppercase; }}
-    tr:hover td {{ background: #2a2a3d; }}
-    h2 {{ color: #89b4fa; margin: 24px 0 12px; font-size: 1.1rem; text-transform: uppercase; letter-spacing: 1px; }}
-    .charts {{ display: flex; flex-wrap: wrap; gap: 16px; }}
-    .chart-card {{
-      background: #313244; border-radius: 10px; padding: 14px; flex: 1 1 420px;
-    }}
-    .chart-card h3 {{ color: #a6adc8; font-size: 0.85rem; margin-bottom: 8px; }}
-    .chart-card img {{ width: 100%; border-radius: 6px; }}
-    footer {{ color: #585b70; font-size: 0.8rem; margin-top: 32px; text-align: center; }}
-  </style>
-</head>
-<body>
-  <header>
-    <h1>🛡 Token Guardian Report &nbsp;<span class="badge">{risk_level}</span></h1>
-    <p>Token: <strong>{token_name}</strong> ({token_symbol}) · Address: {token_address}</p>
-    <p>Generated: {datetime.now(tz=timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}</p>
-  </header>
-
-  <div class="score-card">
-    <div class="score-number">{total_score}</div>
-    <div>
-      <div style="font-size:1.4rem;font-weight:700">Risk Score <span class="badge">{risk_level}</span></div>
-      <div style="color:#a6adc8;margin-top:4px">0 = safe · 100 = critical</div>
-    </div>
-  </div>
-
-  <div class="info-grid">
-    <div class="info-card">
-      <div class="label">Mint Authority</div>
-      <div class="value" style="color:{'#4CAF50' if risk_result.get('mint_authority_revoked') else '#F44336'}">
-        {'✓ Revoked' if risk_result.get('mint_authority_revoked') else '✗ NOT Revoked'}
-      </div>
-    </div>
-    <div class="info-card">
-      <div class="label">Freeze Authority</div>
-      <div class="value" style="color:{'#4CAF50' if risk_result.get('freeze_authority_revoked') else '#F44336'}">
-        {'✓ Revoked' if risk_result.get('freeze_authority_revoked') else '✗ NOT Revoked'}
-      </div>
-    </div>
-    <div class="info-card">
-      <div class="label">Top-10 Concentration</div>
-      <div class="value">{risk_result.get('top10_concentration', 0):.1f}%</div>
-    </div>
-    <div class="info-card">
-      <div class="label">Bot Activity</div>
-      <div class="value">{risk_result.get('bot_percentage', 0):.1f}%</div>
-    </div>
-    <div class="info-card">
-      <div class="label">Bundled Wallets</div>
-      <div class="value">{risk_result.get('bundled_wallet_percentage', 0):.1f}%</div>
-    </div>
-    <div class="info-card">
-      <div class="label">Liquidity Info</div>
-      <div class="value" style="color:{'#4CAF50' if risk_result.get('liquidity_locked') else '#F44336'}">
-        {'✓ Found' if risk_result.get('liquidity_locked') else '✗ Not Found'}
-      </div>
-    </div>
-    <div class="info-card">
-      <div class="label">Total Wallets Analysed</div>
-      <div class="value">{trader_analysis.get('total_wallets', 0)}</div>
-    </div>
-    <div class="info-card">
-      <div class="label">Bundles Detected</div>
-      <div class="value">{bundle_analysis.get('total_bundles', 0)} ({bundle_analysis.get('suspicious_bundles', 0)} suspicious)</div>
-    </div>
-  </div>
-
-  <h2>⚠ Triggered Risk Factors</h2>
-  {'<p style="color:#a6adc8">No risk factors triggered.</p>' if not risk_result.get('factors') else ''}
-  {'<table><thead><tr><th>Factor</th><th>Points</th><th>Description</th></tr></thead><tbody>' + factors_rows + '</tbody></table>' if risk_result.get('factors') else ''}
-
-  <h2>📊 Charts</h2>
-  <div class="charts">
-    {charts_html if charts_html else '<p style="color:#a6adc8">No charts generated.</p>'}
-  </div>
-
-  <footer>Solana Token Guardian Agent · Report generated at {datetime.now(tz=timezone.utc).isoformat()}</footer>
-</body>
-</html>"""
+        now = datetime.now(tz=timezone.utc)
+
+        html = _HTML_TEMPLATE.substitute(
+            # Name/symbol come straight from on-chain metadata and are
+            # attacker-controlled; escape them before they reach the markup.
+            token_name=escape(token_info.get("name", "Unknown")),
+            token_symbol=escape(token_info.get("symbol", "???")),
+            token_address=escape(token_address),
+            token_address_short=escape(token_address[:8]),
+            generated_at=now.strftime("%Y-%m-%d %H:%M UTC"),
+            generated_iso=now.isoformat(),
+            risk_level=risk_level,
+            risk_color=risk_color,
+            total_score=risk_result.get("total_score", 0),
+            info_cards=info_cards,
+            factors_section=factors_section,
+            charts_section=charts_html
+            if charts_html
+            else '<p style="color:#a6adc8">No charts generated.</p>',
+        )
 
-        filename = f"report_{token_address[:8]}_{self._ts()}.html"
+        filename = f"report_{token_address[:8]}_{self._ts(now)}.html"
         out_path = self.output_dir / filename
-        out_path.write_text(html, encoding="utf-8")
+        out_path.write_bytes(html.encode("utf-8"))
         return str(out_path)
 
     # ------------------------------------------------------------------
@@ -234,11 +321,11 @@ class ReportGenerator:
         risk_result: dict,
     ) -> None:
         """Print a rich formatted terminal dashboard."""
-        try:
+        if _RICH:
             self._print_rich_dashboard(
                 token_address, token_info, trader_analysis, bundle_analysis, risk_result
             )
-        except ImportError:
+        else:
             self._print_plain_dashboard(
                 token_address, token_info, trader_analysis, bundle_analysis, risk_result
             )
@@ -255,12 +342,6 @@ class ReportGenerator:
         bundle_analysis: dict,
         risk_result: dict,
     ) -> None:
-        from rich.console import Console
-        from rich.table import Table
-        from rich.panel import Panel
-        from rich.columns import Columns
-        from rich import box
-
         console = Console()
 
         risk_level = risk_result.get("risk_level", "UNKNOWN")
@@ -372,5 +453,7 @@ class ReportGenerator:
         print(sep)
 
     @staticmethod
-    def _ts() -> str:
-        return datetime.now().strftime("%Y%m%d_%H%M%S")
+    def _ts(now: datetime | None = None) -> str:
+        # Reuse the report's own timestamp so the filename matches the
+        # generated_at fields instead of taking a second clock reading.
+        return (now or datetime.now()).strftime("%Y%m%d_%H%M%S")
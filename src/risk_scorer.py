@@ -4,6 +4,18 @@ Risk scorer – aggregates signals into a 0-100 risk score.
 
 from __future__ import annotations
 
+import heapq
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class _Factor:
+    """Immutable risk-factor definition; attribute access beats dict lookups."""
+
+    id: str
+    points: int
+    description: str
+
 
 class RiskScorer:
     """Computes a composite risk score for a Solana token."""
@@ -11,48 +23,51 @@ class RiskScorer:
     # ------------------------------------------------------------------
     # Risk factor weights
     # ------------------------------------------------------------------
-    _FACTORS = [
-        {
-            "id": "mint_authority_not_revoked",
-            "points": 25,
-            "description": "Mint authority has NOT been revoked – developer can mint unlimited tokens",
-        },
-        {
-            "id": "freeze_authority_not_revoked",
-            "points": 20,
-            "description": "Freeze authority has NOT been revoked – developer can freeze holder wallets",
-        },
-        {
-            "id": "top10_concentration_high",
-            "points": 20,
-            "description": "Top 10 holders own >80% of supply – extreme concentration risk",
-        },
-        {
-            "id": "top10_concentration_medium",
-            "points": 10,
-            "description": "Top 10 holders own 50–80% of supply – elevated concentration risk",
-        },
-        {
-            "id": "bundler_percentage_high",
-            "points": 15,
-            "description": "More than 30% of wallets are bundled – likely coordinated launch",
-        },
-        {
-            "id": "bot_percentage_high",
-            "points": 10,
-            "description": "More than 50% of active wallets appear to be bots",
-        },
-        {
-            "id": "no_liquidity_info",
-            "points": 10,
-            "description": "No liquidity pool information found – token may be illiquid",
-        },
-        {
-            "id": "rugcheck_high_risk",
-            "points": 20,
-            "description": "RugCheck.xyz flagged this token as high risk (score > 500)",
-        },
-    ]
+    _FACTORS = (
+        _Factor(
+            id="mint_authority_not_revoked",
+            points=25,
+            description="Mint authority has NOT been revoked – developer can mint unlimited tokens",
+        ),
+        _Factor(
+            id="freeze_authority_not_revoked",
+            points=20,
+            description="Freeze authority has NOT been revoked – developer can freeze holder wallets",
+        ),
+        _Factor(
+            id="top10_concentration_high",
+            points=20,
+            description="Top 10 holders own >80% of supply – extreme concentration risk",
+        ),
+        _Factor(
+            id="top10_concentration_medium",
+            points=10,
+            description="Top 10 holders own 50–80% of supply – elevated concentration risk",
+        ),
+        _Factor(
+            id="bundler_percentage_high",
+            points=15,
+            description="More than 30% of wallets are bundled – likely coordinated launch",
+        ),
+        _Factor(
+            id="bot_percentage_high",
+            points=10,
+            description="More than 50% of active wallets appear to be bots",
+        ),
+        _Factor(
+            id="no_liquidity_info",
+            points=10,
+            description="No liquidity pool information found – token may be illiquid",
+        ),
+        _Factor(
+            id="rugcheck_high_risk",
+            points=20,
+            description="RugCheck.xyz flagged this token as high risk (score > 500)",
+        ),
+    )
+
+    # O(1) lookup table; _add resolves factors by id on every trigger.
+    _FACTORS_BY_ID = {f.id: f for f in _FACTORS}
 
     # ------------------------------------------------------------------
     # Public API
@@ -90,17 +105,15 @@ class RiskScorer:
         # --- Helper to register a factor ---
         def _add(factor_id: str):
             nonlocal accumulated_points
-            for f in self._FACTORS:
-                if f["id"] == factor_id:
-                    accumulated_points += f["points"]
-                    triggered_factors.append(
-                        {
-                            "name": factor_id,
-                            "points": f["points"],
-                            "description": f["description"],
-                        }
-                    )
-                    return
+            f = self._FACTORS_BY_ID[factor_id]
+            accumulated_points += f.points
+            triggered_factors.append(
+                {
+                    "name": factor_id,
+                    "points": f.points,
+                    "description": f.description,
+                }
+            )
 
         # ── Mint / freeze authority ──────────────────────────────────────
         mint_revoked = bool(token_data.get("mint_authority_revoked", False))
@@ -163,7 +176,8 @@ class RiskScorer:
         """Sum percentages of the top 10 holders."""
         if not holders:
             return 0.0
-        top10 = sorted(holders, key=lambda h: h.get("percentage", 0), reverse=True)[:10]
+        # Partial selection: only the top 10 matter, no full sort needed.
+        top10 = heapq.nlargest(10, holders, key=lambda h: h.get("percentage", 0))
         return sum(h.get("percentage", 0) for h in top10)
 
     @staticmethod
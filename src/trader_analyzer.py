@@ -4,9 +4,40 @@ Trader analyzer – classifies wallets as real traders, bots, wash traders, or s
 
 from __future__ import annotations
 
+import sys
 from collections import defaultdict
+from dataclasses import asdict, dataclass
 from typing import Any
 
+import numpy as np
+
+
+@dataclass(slots=True)
+class TraderDetail:
+    """One wallet's classification row.
+
+    Slotted dataclass instead of a dict: no per-row hash table, so a
+    large token's detail list is materially smaller and faster to build.
+    Subscript access is kept for existing callers that treat rows as
+    dicts; convert with :meth:`to_dict` only at serialization time.
+    """
+
+    wallet: str
+    label: str
+    txn_count: int
+    is_bot: bool
+    is_wash_trader: bool
+    is_sybil: bool
+
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
 
 class TraderAnalyzer:
     """Analyses on-chain transaction data to classify wallet behaviour."""
@@ -22,71 +53,225 @@ class TraderAnalyzer:
     # Public API
     # ---------------------------------------------------------------------------
 
-    def analyze(self, transactions: list[dict], holders: list[dict]) -> dict:
+    def analyze(
+        self,
+        transactions: list[dict],
+        holders: list[dict],
+        include_details: bool = True,
+    ) -> dict:
         """
         Classify wallets and return aggregated analysis.
 
+        The work is fused into three linear stages rather than one pass
+        per heuristic: a single scan of ``transactions`` builds every
+        index (timestamp column, per-wallet indices, slot and buy/sell
+        event tables), one vectorized batch flags bots, and one sweep
+        over wallets evaluates bot/wash/sybil together while that
+        wallet's data is hot, emitting its counts and detail row in
+        place.
+
         Returns a dict with keys: total_wallets, real_traders, bots,
-        wash_traders, sybil_wallets, trader_details, bot_percentage.
+        wash_traders, sybil_wallets, trader_details (a list of
+        :class:`TraderDetail` rows), trader_details_by_wallet (the same
+        rows keyed by wallet for O(1) lookup), bot_percentage.
+        Callers that only need the aggregate counts can pass
+        ``include_details=False`` to skip building the per-wallet
+        trader_details rows entirely.
         """
         if not transactions:
             return self._empty_result()
 
-        # Build per-wallet transaction lists
-        wallet_txns: dict[str, list[dict]] = defaultdict(list)
-        for txn in transactions:
-            fee_payer = txn.get("feePayer") or txn.get("fee_payer")
-            if fee_payer:
-                wallet_txns[fee_payer].append(txn)
+        # Struct-of-arrays view of the transaction list: each wallet holds a
+        # list of indices into a parallel timestamp column rather than a list
+        # of the dicts themselves, so the detectors slice contiguous arrays
+        # instead of re-walking nested dicts. NaN marks a missing timestamp.
+        # Wallets are factorized on sight to dense integer codes (addresses
+        # are ~44-char base58 strings, still interned once for the code
+        # lookup itself); every index below is keyed by code, so the hot
+        # paths hash and compare machine ints instead of long strings.
+        intern = sys.intern
+        ts_col = np.full(len(transactions), np.nan, dtype=np.float64)
+        wallet_code: dict[str, int] = {}
+        wallet_txn_idx: list[list[int]] = []
+
+        # Slot-level indices for sybil detection, built in the same pass.
+        # _is_sybil used to rebuild these from the full transaction list for
+        # every wallet (O(wallets × transactions)); with the reverse index
+        # each wallet now only inspects the slots it actually appears in.
+        slot_wallets: dict[Any, set[int]] = defaultdict(set)
+        wallet_slots: dict[int, set[Any]] = defaultdict(set)
+
+        # Transfer amounts as flat columns (slot code, amount) rather than a
+        # list per slot; the per-slot stats then fall out of one group-by.
+        slot_codes: dict[Any, int] = {}
+        amt_codes: list[int] = []
+        amt_vals: list[float] = []
 
-            # Also capture wallets mentioned in token transfers so we track
-            # all participating addresses, even those that aren't the fee payer.
+        # Wash-trading events as flat parallel columns (pair id, timestamp,
+        # direction) with 1 = buy and 0 = sell, one pair id per
+        # (wallet code, mint). A single lexsort afterwards time-orders
+        # every pair's run at once instead of sorting each list separately.
+        pair_ids: dict[tuple[int, str], int] = {}
+        pair_wallet: list[int] = []
+        ev_pid: list[int] = []
+        ev_ts: list[float] = []
+        ev_dir: list[int] = []
+
+        def _code(addr: str) -> int:
+            code = wallet_code.setdefault(intern(addr), len(wallet_code))
+            if code == len(wallet_txn_idx):
+                wallet_txn_idx.append([])
+            return code
+
+        for i, txn in enumerate(transactions):
+            fp = txn.get("feePayer") or txn.get("fee_payer")
+            slot = txn.get("slot")
+            ts = txn.get("timestamp")
+            if ts is not None:
+                ts_col[i] = ts
+            fp_code = -1
+            if fp:
+                fp_code = _code(fp)
+                wallet_txn_idx[fp_code].append(i)
+                if slot is not None:
+                    slot_wallets[slot].add(fp_code)
+                    wallet_slots[fp_code].add(slot)
             for transfer in txn.get("tokenTransfers", []):
+                # Also capture wallets mentioned in token transfers so we
+                # track all participating addresses, even those that aren't
+                # the fee payer.
                 for key in ("fromUserAccount", "toUserAccount"):
                     addr = transfer.get(key)
-                    if addr and addr not in wallet_txns:
-                        wallet_txns[addr]  # initialize empty list via defaultdict
+                    if addr:
+                        _code(addr)
+                if fp_code < 0:
+                    continue
+                if slot is not None:
+                    amt = transfer.get("tokenAmount")
+                    if amt is not None:
+                        try:
+                            val = float(amt)
+                        except (TypeError, ValueError):
+                            pass
+                        else:
+                            amt_codes.append(slot_codes.setdefault(slot, len(slot_codes)))
+                            amt_vals.append(val)
+                if ts is not None:
+                    mint = transfer.get("mint")
+                    if mint:
+                        pid = pair_ids.setdefault((fp_code, intern(mint)), len(pair_ids))
+                        if pid == len(pair_wallet):
+                            pair_wallet.append(fp_code)
+                        ev_pid.append(pid)
+                        ev_ts.append(ts)
+                        ev_dir.append(1 if transfer.get("toUserAccount") else 0)
+
+        # Group the events into per-wallet, per-mint runs. One C-level
+        # lexsort orders all runs by timestamp at once; pair ids are dense,
+        # so searchsorted over them yields each run's slice boundaries.
+        wallet_events: dict[int, list[list[tuple[float, int]]]] = defaultdict(list)
+        if ev_pid:
+            pid_arr = np.asarray(ev_pid, dtype=np.int64)
+            ts_arr = np.asarray(ev_ts, dtype=np.float64)
+            dir_arr = np.asarray(ev_dir, dtype=np.int64)
+            order = np.lexsort((ts_arr, pid_arr))
+            pid_arr = pid_arr[order]
+            ts_list = ts_arr[order].tolist()
+            dir_list = dir_arr[order].tolist()
+            starts = np.searchsorted(pid_arr, np.arange(len(pair_ids)))
+            ends = np.append(starts[1:], pid_arr.size)
+            for pid, wallet in enumerate(pair_wallet):
+                s, e = starts[pid], ends[pid]
+                wallet_events[wallet].append(list(zip(ts_list[s:e], dir_list[s:e])))
+
+        # Reduce each slot's amounts to (count, unique count) once, so the
+        # identical-amounts test in _is_sybil is a plain comparison instead
+        # of a fresh set build per wallet inspection. Both reductions are
+        # C-level group-bys: np.unique over (slot code, amount) pairs yields
+        # the distinct amounts per slot, over the codes alone the totals.
+        slot_amount_stats: dict[Any, tuple[int, int]] = {}
+        if amt_vals:
+            codes_arr = np.asarray(amt_codes, dtype=np.float64)
+            vals_arr = np.asarray(amt_vals, dtype=np.float64)
+            _, total_counts = np.unique(codes_arr, return_counts=True)
+            distinct_codes = np.unique(np.stack((codes_arr, vals_arr), axis=1), axis=0)[:, 0]
+            _, unique_counts = np.unique(distinct_codes, return_counts=True)
+            slot_amount_stats = {
+                slot: (int(total_counts[code]), int(unique_counts[code]))
+                for slot, code in slot_codes.items()
+            }
 
-        all_wallets = list(wallet_txns.keys())
-        details: list[dict] = []
+        details: list[TraderDetail] = []
         counts = {"real": 0, "bot": 0, "wash_trader": 0, "sybil": 0}
 
-        for wallet, txns in wallet_txns.items():
-            is_bot = self._is_bot(txns)
-            is_wash = self._is_wash_trader(txns, transactions)
-            is_sybil = self._is_sybil(wallet, all_wallets, transactions)
+        # Bot detection runs for every wallet, so it is batched: one
+        # vectorized pass over all candidates instead of a numpy round-trip
+        # per wallet.
+        bot_flags = self._detect_bots(wallet_txn_idx, ts_col)
+
+        for wallet, code in wallet_code.items():
+            idxs = wallet_txn_idx[code]
+            # Transfer-only participants have no fee-paying transactions and
+            # can never trip a predicate (they are absent from every index);
+            # classify them as real without running the chain.
+            if not idxs:
+                counts["real"] += 1
+                if include_details:
+                    details.append(
+                        TraderDetail(
+                            wallet=wallet,
+                            label="real",
+                            txn_count=0,
+                            is_bot=False,
+                            is_wash_trader=False,
+                            is_sybil=False,
+                        )
+                    )
+                continue
 
+            # The label takes the first positive in bot → wash → sybil order,
+            # so later predicates can't influence it once one fires; skip
+            # them instead of computing results that would be discarded.
+            is_wash = is_sybil = False
+            is_bot = bool(bot_flags[code])
             if is_bot:
                 label = "bot"
-            elif is_wash:
-                label = "wash_trader"
-            elif is_sybil:
-                label = "sybil"
             else:
-                label = "real"
+                is_wash = self._is_wash_trader(len(idxs), wallet_events.get(code, ()))
+                if is_wash:
+                    label = "wash_trader"
+                else:
+                    is_sybil = self._is_sybil(
+                        code, slot_wallets, slot_amount_stats, wallet_slots
+                    )
+                    label = "sybil" if is_sybil else "real"
 
             counts[label] += 1
-            details.append(
-                {
-                    "wallet": wallet,
-                    "label": label,
-                    "txn_count": len(txns),
-                    "is_bot": is_bot,
-                    "is_wash_trader": is_wash,
-                    "is_sybil": is_sybil,
-                }
-            )
-
-        total = len(all_wallets) or 1  # avoid division by zero
+            if include_details:
+                details.append(
+                    TraderDetail(
+                        wallet=wallet,
+                        label=label,
+                        txn_count=len(idxs),
+                        is_bot=is_bot,
+                        is_wash_trader=is_wash,
+                        is_sybil=is_sybil,
+                    )
+                )
+
+        total = len(wallet_code) or 1  # avoid division by zero
         bot_pct = round((counts["bot"] / total) * 100, 2)
 
         return {
-            "total_wallets": len(all_wallets),
+            "total_wallets": len(wallet_code),
             "real_traders": counts["real"],
             "bots": counts["bot"],
             "wash_traders": counts["wash_trader"],
             "sybil_wallets": counts["sybil"],
             "trader_details": details,
+            # Same detail rows keyed by wallet: O(1) lookup for callers,
+            # the list stays for ordered/JSON output.
+            "trader_details_by_wallet": {d.wallet: d for d in details},
             "bot_percentage": bot_pct,
         }
 
@@ -94,104 +279,118 @@ class TraderAnalyzer:
     # Classification helpers
     # ---------------------------------------------------------------------------
 
-    def _is_bot(self, wallet_txns: list[dict]) -> bool:
+    def _detect_bots(
+        self, wallet_txn_idx: list[list[int]], ts_col: np.ndarray
+    ) -> np.ndarray:
         """
-        Flag as bot if:
+        Flag wallets as bots in one vectorized pass. A wallet is a bot if:
         - More than BOT_MIN_TXNS transactions, AND
         - Average interval between consecutive transactions < BOT_AVG_INTERVAL_SECS
+
+        Candidate wallets' timestamps are gathered from the shared column
+        into a single flat array, lexsorted by (wallet code, timestamp);
+        each wallet is then a contiguous run whose stats come from C-level
+        slicing instead of a Python loop per wallet. Returns a boolean
+        array indexed by wallet code.
         """
-        if len(wallet_txns) <= self.BOT_MIN_TXNS:
-            return False
+        flags = np.zeros(len(wallet_txn_idx), dtype=bool)
+        cand_codes = [
+            c for c, idxs in enumerate(wallet_txn_idx)
+            if len(idxs) > self.BOT_MIN_TXNS
+        ]
+        if not cand_codes:
+            return flags
 
-        timestamps = sorted(
-            t for t in (txn.get("timestamp") for txn in wallet_txns) if t is not None
+        idx_lists = [wallet_txn_idx[c] for c in cand_codes]
+        lengths = np.fromiter((len(l) for l in idx_lists), dtype=np.int64)
+        flat = np.fromiter(
+            (i for idxs in idx_lists for i in idxs),
+            dtype=np.int64,
+            count=int(lengths.sum()),
         )
-        if len(timestamps) < 2:
-            return False
+        code_arr = np.repeat(np.asarray(cand_codes, dtype=np.int64), lengths)
+        ts_arr = ts_col[flat]
+        valid = ~np.isnan(ts_arr)
+        code_arr = code_arr[valid]
+        ts_arr = ts_arr[valid]
+        if ts_arr.size == 0:
+            # Candidates can lose all timestamps to None filtering; they
+            # stay unflagged.
+            return flags
+
+        order = np.lexsort((ts_arr, code_arr))
+        code_arr = code_arr[order]
+        ts_arr = ts_arr[order]
 
-        intervals = [timestamps[i + 1] - timestamps[i] for i in range(len(timestamps) - 1)]
-        avg_interval = sum(intervals) / len(intervals)
-        return avg_interval < self.BOT_AVG_INTERVAL_SECS
+        # Per-wallet runs in the sorted arrays. Timestamps are sorted
+        # within each run, so the mean consecutive interval telescopes to
+        # (last - first) / (n - 1) — no diff array needed.
+        present, starts = np.unique(code_arr, return_index=True)
+        ends = np.append(starts[1:], code_arr.size)
+        n = ends - starts
+        span = ts_arr[ends - 1] - ts_arr[starts]
+        flags[present] = (n >= 2) & (
+            span / np.maximum(n - 1, 1) < self.BOT_AVG_INTERVAL_SECS
+        )
+        return flags
 
-    def _is_wash_trader(self, wallet_txns: list[dict], all_txns: list[dict]) -> bool:  # noqa: ARG002
+    def _is_wash_trader(
+        self,
+        txn_count: int,
+        mint_event_lists: list[list[tuple[float, int]]] | tuple,
+    ) -> bool:
         """
         Flag as wash trader if a wallet both bought and sold the same token
         multiple times within a short window.
+
+        ``mint_event_lists`` is the wallet's slice of the global index built
+        in analyze(): one pre-sorted (timestamp, direction) list per mint.
         """
-        if len(wallet_txns) < self.WASH_MIN_CYCLES * 2:
+        if txn_count < self.WASH_MIN_CYCLES * 2:
             return False
 
-        # Build timeline of buy/sell events per token
-        events: dict[str, list[dict]] = defaultdict(list)
-        for txn in wallet_txns:
-            ts = txn.get("timestamp")
-            if ts is None:
-                continue
-            for transfer in txn.get("tokenTransfers", []):
-                mint = transfer.get("mint")
-                if not mint:
-                    continue
-                direction = "buy" if transfer.get("toUserAccount") else "sell"
-                events[mint].append({"ts": ts, "dir": direction})
-
-        for mint_events in events.values():
-            sorted_events = sorted(mint_events, key=lambda e: e["ts"])
-            cycles = self._count_buy_sell_cycles(sorted_events)
-            if cycles >= self.WASH_MIN_CYCLES:
+        for events in mint_event_lists:
+            if self._count_buy_sell_cycles(events) >= self.WASH_MIN_CYCLES:
                 return True
 
         return False
 
-    def _count_buy_sell_cycles(self, events: list[dict]) -> int:
+    def _count_buy_sell_cycles(self, events: list[tuple[float, int]]) -> int:
         """Count completed buy→sell cycles within the wash trading window."""
         cycles = 0
         bought_at: float | None = None
-        for ev in events:
-            if ev["dir"] == "buy":
-                bought_at = ev["ts"]
-            elif ev["dir"] == "sell" and bought_at is not None:
-                if ev["ts"] - bought_at <= self.WASH_WINDOW_SECS:
+        for ts, direction in events:
+            if direction:  # buy
+                bought_at = ts
+            elif bought_at is not None:  # sell closing an open buy
+                if ts - bought_at <= self.WASH_WINDOW_SECS:
                     cycles += 1
                     bought_at = None  # reset after completing cycle
         return cycles
 
-    def _is_sybil(self, wallet: str, all_wallets: list[str], transactions: list[dict]) -> bool:
+    def _is_sybil(
+        self,
+        wallet: int,
+        slot_wallets: dict[Any, set[int]],
+        slot_amount_stats: dict[Any, tuple[int, int]],
+        wallet_slots: dict[int, set[Any]],
+    ) -> bool:
         """
         Flag as sybil if this wallet co-appears (same block/slot) with
         SYBIL_CLUSTER_SIZE or more other wallets that also share identical transfer amounts.
-        """
-        # Group transactions by slot
-        slot_wallets: dict[Any, set[str]] = defaultdict(set)
-        slot_amounts: dict[Any, list[float]] = defaultdict(list)
 
-        for txn in transactions:
-            slot = txn.get("slot")
-            fp = txn.get("feePayer") or txn.get("fee_payer")
-            if slot is None or not fp:
-                continue
-            slot_wallets[slot].add(fp)
-            for transfer in txn.get("tokenTransfers", []):
-                amt = transfer.get("tokenAmount")
-                if amt is not None:
-                    try:
-                        slot_amounts[slot].append(float(amt))
-                    except (TypeError, ValueError):
-                        pass
-
-        # Check if this wallet appears in any slot with enough co-wallets + same amounts
-        for slot, wallets_in_slot in slot_wallets.items():
-            if wallet not in wallets_in_slot:
-                continue
-            others = wallets_in_slot - {wallet}
-            if len(others) < self.SYBIL_CLUSTER_SIZE:
+        Operates on the slot indices prebuilt in analyze(), visiting only the
+        slots this wallet participates in.
+        """
+        for slot in wallet_slots.get(wallet, ()):
+            # The wallet itself is in the slot's set, so co-wallets = size - 1.
+            if len(slot_wallets[slot]) - 1 < self.SYBIL_CLUSTER_SIZE:
                 continue
             # Check for identical amounts (sybil clusters tend to transact exact same amounts)
-            amounts = slot_amounts.get(slot, [])
-            if amounts and len(amounts) > 1:
-                unique_amounts = set(amounts)
-                # If 80%+ of amounts are the same value, suspicious
-                if len(unique_amounts) <= max(1, len(amounts) // 5):
-                    return True
+            count, unique = slot_amount_stats.get(slot, (0, 0))
+            # If 80%+ of amounts are the same value, suspicious
+            if count > 1 and unique <= max(1, count // 5):
+                return True
 
         return False
 
@@ -208,5 +407,6 @@ class TraderAnalyzer:
             "wash_traders": 0,
             "sybil_wallets": 0,
             "trader_details": [],
+            "trader_details_by_wallet": {},
             "bot_percentage": 0.0,
         }
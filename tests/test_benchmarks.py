@@ -0,0 +1,42 @@
+"""
+Performance regression benchmarks for TraderAnalyzer.
+
+These pin the analyzer's scaling behaviour so an accidental O(N²) pass
+fails review, not production. They need the pytest-benchmark plugin and
+skip themselves when it is not installed; run them with:
+
+    pytest tests/test_benchmarks.py --benchmark-only
+"""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from src.trader_analyzer import TraderAnalyzer
+from tests.test_trader_analyzer import _make_high_freq_txns, _make_txn_bulk
+
+
+@pytest.mark.benchmark(group="analyze", min_rounds=5)
+class TestAnalyzerPerformance:
+    def test_analyze_single_hot_wallet(self, benchmark):
+        """One wallet firing 10k rapid transactions (bot path)."""
+        txns = _make_high_freq_txns("hot_wallet", count=10_000, interval_secs=2.0)
+        result = benchmark(TraderAnalyzer().analyze, txns, [])
+        assert result["bots"] == 1
+
+    def test_analyze_many_wallets(self, benchmark):
+        """1k wallets with 10 transactions each (per-wallet indexing path)."""
+        base = 1_700_000_000.0
+        txns = []
+        for w in range(1_000):
+            txns.extend(
+                _make_txn_bulk(
+                    f"wallet_{w}",
+                    [base + i * 120.0 for i in range(10)],
+                    slot_base=w * 10,
+                )
+            )
+        result = benchmark(TraderAnalyzer().analyze, txns, [])
+        assert result["total_wallets"] == 1_000
@@ -166,6 +166,18 @@ class TestEdgeCases:
         result = detector.detect(txns)
         assert result["total_bundles"] == 0
 
+    def test_mixed_fee_payer_spellings(self):
+        """Wallets must not be dropped when feePayer and fee_payer are mixed."""
+        txns = [
+            {"feePayer": "a", "slot": 10},
+            {"fee_payer": "b", "slot": 10},
+            {"fee_payer": "c", "slot": 10},
+        ]
+        detector = BundlerDetector()
+        result = detector.detect(txns)
+        assert result["total_bundles"] == 1
+        assert sorted(result["bundle_groups"][0]["wallets"]) == ["a", "b", "c"]
+
     def test_returns_expected_keys(self):
         detector = BundlerDetector()
         result = detector.detect([])
@@ -192,3 +204,20 @@ class TestEdgeCases:
         detector = BundlerDetector()
         result = detector.detect(txns)
         assert result["bundle_groups"][0]["size"] == 3  # 3 unique wallets
+
+
+# ---------------------------------------------------------------------------
+# Bundle intersection helper
+# ---------------------------------------------------------------------------
+
+class TestIntersectBundles:
+    def test_common_wallets_across_bundles(self):
+        bundles = [
+            {"wallets": ("a", "b", "c")},
+            {"wallets": ("b", "c", "d")},
+            {"wallets": ("c", "b", "e")},
+        ]
+        assert BundlerDetector.intersect_bundles(bundles) == frozenset({"b", "c"})
+
+    def test_empty_input_returns_empty_frozenset(self):
+        assert BundlerDetector.intersect_bundles([]) == frozenset()
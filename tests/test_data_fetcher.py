@@ -4,6 +4,10 @@ Unit tests for DataFetcher.
 
 from __future__ import annotations
 
+import json
+from types import MappingProxyType, SimpleNamespace
+from unittest import mock
+
 import pytest
 import requests
 
@@ -17,10 +21,122 @@ from src.data_fetcher import DataFetcher
 TOKEN = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"  # example (USDC mint)
 HELIUS_KEY = "test_api_key"
 
+# Canonical API payloads, built once at import instead of per test. They are
+# plain dicts (json.dumps in _MockResponse.content needs them to be) but are
+# treated as read-only by every test.
+_TOKEN_INFO_RESP = {
+    "jsonrpc": "2.0",
+    "id": "1",
+    "result": {
+        "content": {
+            "metadata": {"name": "USD Coin", "symbol": "USDC", "description": "A stablecoin"},
+            "links": {"image": "https://example.com/usdc.png"},
+        },
+        "token_info": {
+            "supply": 1_000_000_000,
+            "decimals": 6,
+            "freeze_authority": None,
+        },
+        "authorities": [],
+    },
+}
+
+_TOKEN_INFO_NO_MINT_SCOPE = {
+    "jsonrpc": "2.0",
+    "id": "1",
+    "result": {
+        "content": {"metadata": {"name": "T", "symbol": "T"}, "links": {}},
+        "token_info": {"supply": 100, "decimals": 9, "freeze_authority": None},
+        "authorities": [{"scopes": ["update"]}],  # no "mint" scope
+    },
+}
+
+_TOKEN_INFO_WITH_FREEZE = {
+    "jsonrpc": "2.0",
+    "id": "1",
+    "result": {
+        "content": {"metadata": {"name": "T", "symbol": "T"}, "links": {}},
+        "token_info": {"supply": 100, "decimals": 9, "freeze_authority": "some_authority"},
+        "authorities": [],
+    },
+}
+
+_SUPPLY_RESP = {
+    "jsonrpc": "2.0",
+    "id": "1",
+    "result": {
+        "value": {
+            "amount": "1000000000",
+            "decimals": 6,
+            "uiAmount": 1000.0,
+            "uiAmountString": "1000",
+        }
+    },
+}
+
+_TXN_LIST = [
+    {"signature": "sig1", "feePayer": "wallet1", "timestamp": 1700000000, "tokenTransfers": []},
+    {"signature": "sig2", "feePayer": "wallet2", "timestamp": 1700000001, "tokenTransfers": []},
+]
+
+_RUGCHECK_DATA = {
+    "score": 300,
+    "markets": [{"id": "raydium_pool_1"}],
+    "risks": [],
+    "tokenMeta": {"name": "Test Token"},
+}
+
+_BATCH_ASSET_RESP = {
+    "id": "0",
+    "result": {
+        "content": {"metadata": {"name": "Test", "symbol": "TST"}, "links": {}},
+        "token_info": {"supply": 100, "decimals": 6, "freeze_authority": None},
+        "authorities": [],
+    },
+}
+
+_BATCH_SUPPLY_RESP = {
+    "id": "1",
+    "result": {"value": {"amount": "100", "decimals": 6, "uiAmount": 100.0, "uiAmountString": "100"}},
+}
+
+_BATCH_LARGEST_RESP = {
+    "id": "2",
+    "result": {"value": [{"address": "w1", "uiAmount": 10.0, "uiAmountString": "10"}]},
+}
+
+
+@pytest.fixture(scope="module")
+def _shared_fetcher() -> DataFetcher:
+    """One fetcher (and pooled session) for the whole module."""
+    return DataFetcher(helius_api_key=HELIUS_KEY, rugcheck_api_key="test_rugcheck_key")
+
 
 @pytest.fixture()
-def fetcher() -> DataFetcher:
-    return DataFetcher(helius_api_key=HELIUS_KEY, rugcheck_api_key="test_rugcheck_key")
+def fetcher(_shared_fetcher: DataFetcher) -> DataFetcher:
+    """The shared fetcher with its memoization caches cleared per test."""
+    _shared_fetcher._token_info_cache.clear()
+    _shared_fetcher._token_supply_cache.clear()
+    _shared_fetcher._rugcheck_cache.clear()
+    return _shared_fetcher
+
+
+@pytest.fixture(scope="module")
+def _session_patches():
+    """Patch Session.post/get once per module instead of once per test."""
+    post_patcher = mock.patch("src.data_fetcher.requests.Session.post")
+    get_patcher = mock.patch("src.data_fetcher.requests.Session.get")
+    yield SimpleNamespace(post=post_patcher.start(), get=get_patcher.start())
+    post_patcher.stop()
+    get_patcher.stop()
+
+
+@pytest.fixture()
+def http_mocks(_session_patches) -> SimpleNamespace:
+    """The shared session mocks, reset before each test."""
+    _session_patches.post.reset_mock(return_value=True, side_effect=True)
+    _session_patches.get.reset_mock(return_value=True, side_effect=True)
+    return _session_patches
 
 
 # ---------------------------------------------------------------------------
@@ -28,81 +144,43 @@ def fetcher() -> DataFetcher:
 # ---------------------------------------------------------------------------
 
 class TestGetTokenInfo:
-    def test_returns_parsed_token_info(self, fetcher: DataFetcher, mocker):
-        mock_response = {
-            "jsonrpc": "2.0",
-            "id": "1",
-            "result": {
-                "content": {
-                    "metadata": {"name": "USD Coin", "symbol": "USDC", "description": "A stablecoin"},
-                    "links": {"image": "https://example.com/usdc.png"},
-                },
-                "token_info": {
-                    "supply": 1_000_000_000,
-                    "decimals": 6,
-                    "freeze_authority": None,
-                },
-                "authorities": [],
-            },
-        }
-        mocker.patch("src.data_fetcher.requests.post", return_value=_mock_resp(mock_response))
+    def test_returns_parsed_token_info(self, fetcher: DataFetcher, http_mocks):
+        http_mocks.post.return_value = _mock_resp(_TOKEN_INFO_RESP)
         result = fetcher.get_token_info(TOKEN)
         assert result["name"] == "USD Coin"
         assert result["symbol"] == "USDC"
         assert result["decimals"] == 6
         assert result["address"] == TOKEN
 
-    def test_returns_empty_dict_on_404(self, fetcher: DataFetcher, mocker):
-        mocker.patch(
-            "src.data_fetcher.requests.post",
-            side_effect=requests.exceptions.HTTPError(
-                response=_mock_resp({}, status_code=404)
-            ),
-        )
+    def test_returns_empty_dict_on_404(self, fetcher: DataFetcher, http_mocks):
+        http_mocks.post.side_effect = _HTTP_404
         result = fetcher.get_token_info(TOKEN)
         assert result == {}
 
-    def test_returns_empty_dict_on_network_error(self, fetcher: DataFetcher, mocker):
-        mocker.patch(
-            "src.data_fetcher.requests.post",
-            side_effect=requests.exceptions.ConnectionError("Network unreachable"),
-        )
+    def test_returns_empty_dict_on_network_error(self, fetcher: DataFetcher, http_mocks):
+        http_mocks.post.side_effect = _CONN_ERR
         result = fetcher.get_token_info(TOKEN)
         assert result == {}
 
-    def test_returns_empty_dict_when_result_missing(self, fetcher: DataFetcher, mocker):
-        mocker.patch(
-            "src.data_fetcher.requests.post",
-            return_value=_mock_resp({"jsonrpc": "2.0", "id": "1", "result": None}),
+    def test_returns_empty_dict_on_non_json_body(self, fetcher: DataFetcher, http_mocks):
+        http_mocks.post.return_value = _HTML_RESP
+        result = fetcher.get_token_info(TOKEN)
+        assert result == {}
+
+    def test_returns_empty_dict_when_result_missing(self, fetcher: DataFetcher, http_mocks):
+        http_mocks.post.return_value = _mock_resp(
+            {"jsonrpc": "2.0", "id": "1", "result": None}
         )
         result = fetcher.get_token_info(TOKEN)
         assert result == {}
 
-    def test_mint_authority_revoked_when_no_mint_scope(self, fetcher: DataFetcher, mocker):
-        mock_response = {
-            "jsonrpc": "2.0",
-            "id": "1",
-            "result": {
-                "content": {"metadata": {"name": "T", "symbol": "T"}, "links": {}},
-                "token_info": {"supply": 100, "decimals": 9, "freeze_authority": None},
-                "authorities": [{"scopes": ["update"]}],  # no "mint" scope
-            },
-        }
-        mocker.patch("src.data_fetcher.requests.post", return_value=_mock_resp(mock_response))
+    def test_mint_authority_revoked_when_no_mint_scope(self, fetcher: DataFetcher, http_mocks):
+        http_mocks.post.return_value = _mock_resp(_TOKEN_INFO_NO_MINT_SCOPE)
         result = fetcher.get_token_info(TOKEN)
         assert result["mint_authority_revoked"] is True
 
-    def test_freeze_authority_not_revoked_when_present(self, fetcher: DataFetcher, mocker):
-        mock_response = {
-            "jsonrpc": "2.0",
-            "id": "1",
-            "result": {
-                "content": {"metadata": {"name": "T", "symbol": "T"}, "links": {}},
-                "token_info": {"supply": 100, "decimals": 9, "freeze_authority": "some_authority"},
-                "authorities": [],
-            },
-        }
-        mocker.patch("src.data_fetcher.requests.post", return_value=_mock_resp(mock_response))
+    def test_freeze_authority_not_revoked_when_present(self, fetcher: DataFetcher, http_mocks):
+        http_mocks.post.return_value = _mock_resp(_TOKEN_INFO_WITH_FREEZE)
         result = fetcher.get_token_info(TOKEN)
         assert result["freeze_authority_revoked"] is False
 
@@ -112,29 +190,14 @@ class TestGetTokenInfo:
 # ---------------------------------------------------------------------------
 
 class TestGetTokenSupply:
-    def test_returns_supply_info(self, fetcher: DataFetcher, mocker):
-        mock_response = {
-            "jsonrpc": "2.0",
-            "id": "1",
-            "result": {
-                "value": {
-                    "amount": "1000000000",
-                    "decimals": 6,
-                    "uiAmount": 1000.0,
-                    "uiAmountString": "1000",
-                }
-            },
-        }
-        mocker.patch("src.data_fetcher.requests.post", return_value=_mock_resp(mock_response))
+    def test_returns_supply_info(self, fetcher: DataFetcher, http_mocks):
+        http_mocks.post.return_value = _mock_resp(_SUPPLY_RESP)
         result = fetcher.get_token_supply(TOKEN)
         assert result["uiAmount"] == 1000.0
         assert result["decimals"] == 6
 
-    def test_returns_defaults_on_error(self, fetcher: DataFetcher, mocker):
-        mocker.patch(
-            "src.data_fetcher.requests.post",
-            side_effect=requests.exceptions.ConnectionError(),
-        )
+    def test_returns_defaults_on_error(self, fetcher: DataFetcher, http_mocks):
+        http_mocks.post.side_effect = _CONN_ERR
         result = fetcher.get_token_supply(TOKEN)
         assert result["uiAmount"] == 0
 
@@ -144,30 +207,20 @@ class TestGetTokenSupply:
 # ---------------------------------------------------------------------------
 
 class TestGetRecentTransactions:
-    def test_returns_transaction_list(self, fetcher: DataFetcher, mocker):
-        mock_txns = [
-            {"signature": "sig1", "feePayer": "wallet1", "timestamp": 1700000000, "tokenTransfers": []},
-            {"signature": "sig2", "feePayer": "wallet2", "timestamp": 1700000001, "tokenTransfers": []},
-        ]
-        mocker.patch("src.data_fetcher.requests.get", return_value=_mock_resp(mock_txns))
+    def test_returns_transaction_list(self, fetcher: DataFetcher, http_mocks):
+        http_mocks.get.return_value = _mock_resp(_TXN_LIST)
         result = fetcher.get_recent_transactions(TOKEN)
         assert len(result) == 2
         assert result[0]["signature"] == "sig1"
 
-    def test_returns_empty_list_on_error(self, fetcher: DataFetcher, mocker):
-        mocker.patch(
-            "src.data_fetcher.requests.get",
-            side_effect=requests.exceptions.Timeout(),
-        )
+    def test_returns_empty_list_on_error(self, fetcher: DataFetcher, http_mocks):
+        http_mocks.get.side_effect = _TIMEOUT
         result = fetcher.get_recent_transactions(TOKEN)
         assert result == []
 
-    def test_returns_empty_list_when_response_is_dict(self, fetcher: DataFetcher, mocker):
+    def test_returns_empty_list_when_response_is_dict(self, fetcher: DataFetcher, http_mocks):
         """If the API returns a dict (error) instead of a list, return empty list."""
-        mocker.patch(
-            "src.data_fetcher.requests.get",
-            return_value=_mock_resp({"error": "something went wrong"}),
-        )
+        http_mocks.get.return_value = _mock_resp({"error": "something went wrong"})
         result = fetcher.get_recent_transactions(TOKEN)
         assert result == []
 
@@ -177,42 +230,27 @@ class TestGetRecentTransactions:
 # ---------------------------------------------------------------------------
 
 class TestGetRugcheckReport:
-    def test_returns_rugcheck_data(self, fetcher: DataFetcher, mocker):
-        mock_data = {
-            "score": 300,
-            "markets": [{"id": "raydium_pool_1"}],
-            "risks": [],
-            "tokenMeta": {"name": "Test Token"},
-        }
-        mocker.patch("src.data_fetcher.requests.get", return_value=_mock_resp(mock_data))
+    def test_returns_rugcheck_data(self, fetcher: DataFetcher, http_mocks):
+        http_mocks.get.return_value = _mock_resp(_RUGCHECK_DATA)
         result = fetcher.get_rugcheck_report(TOKEN)
         assert result["score"] == 300
         assert len(result["markets"]) == 1
 
-    def test_returns_empty_on_404(self, fetcher: DataFetcher, mocker):
-        mocker.patch(
-            "src.data_fetcher.requests.get",
-            return_value=_mock_resp({}, status_code=404),
-        )
+    def test_returns_empty_on_404(self, fetcher: DataFetcher, http_mocks):
+        http_mocks.get.return_value = _mock_resp({}, status_code=404)
         result = fetcher.get_rugcheck_report(TOKEN)
         assert result == {}
 
-    def test_returns_empty_on_connection_error(self, fetcher: DataFetcher, mocker):
-        mocker.patch(
-            "src.data_fetcher.requests.get",
-            side_effect=requests.exceptions.ConnectionError("unreachable"),
-        )
+    def test_returns_empty_on_connection_error(self, fetcher: DataFetcher, http_mocks):
+        http_mocks.get.side_effect = _CONN_ERR
         result = fetcher.get_rugcheck_report(TOKEN)
         assert result == {}
 
-    def test_uses_auth_header_when_key_present(self, fetcher: DataFetcher, mocker):
+    def test_uses_auth_header_when_key_present(self, fetcher: DataFetcher, http_mocks):
         """When rugcheck_api_key is set, Authorization header should be included."""
-        mock_get = mocker.patch(
-            "src.data_fetcher.requests.get",
-            return_value=_mock_resp({"score": 100}),
-        )
+        http_mocks.get.return_value = _mock_resp({"score": 100})
         fetcher.get_rugcheck_report(TOKEN)
-        call_kwargs = mock_get.call_args
+        call_kwargs = http_mocks.get.call_args
         headers = call_kwargs.kwargs.get("headers") or call_kwargs.args[1] if len(call_kwargs.args) > 1 else {}
         # Fallback: check the keyword arg 'headers'
         if not headers and call_kwargs.kwargs:
@@ -225,37 +263,17 @@ class TestGetRugcheckReport:
 # ---------------------------------------------------------------------------
 
 class TestRetryLogic:
-    def test_retries_on_server_error(self, fetcher: DataFetcher, mocker):
-        """POST should retry on 5xx error and succeed on second attempt."""
-        success_response = {
-            "jsonrpc": "2.0",
-            "id": "1",
-            "result": {
-                "content": {"metadata": {"name": "Retry Token", "symbol": "RT"}, "links": {}},
-                "token_info": {"supply": 100, "decimals": 9, "freeze_authority": None},
-                "authorities": [],
-            },
-        }
-        server_error = requests.exceptions.HTTPError(
-            response=_mock_resp({}, status_code=503)
-        )
-        # First call fails, second succeeds
-        mock_post = mocker.patch(
-            "src.data_fetcher.requests.post",
-            side_effect=[server_error, _mock_resp(success_response)],
-        )
-        mocker.patch("src.data_fetcher.time.sleep")  # don't actually sleep
-        result = fetcher.get_token_info(TOKEN)
-        assert result.get("name") == "Retry Token"
-        assert mock_post.call_count == 2
-
-    def test_stops_after_max_retries(self, fetcher: DataFetcher, mocker):
-        """After MAX_RETRIES failures, should return empty dict."""
-        mocker.patch(
-            "src.data_fetcher.requests.post",
-            side_effect=requests.exceptions.Timeout("always times out"),
-        )
-        mocker.patch("src.data_fetcher.time.sleep")
+    def test_retry_policy_mounted_on_adapter(self, fetcher: DataFetcher):
+        """Retries with backoff are delegated to urllib3 via the mounted adapter."""
+        adapter = fetcher._session.get_adapter("https://mainnet.helius-rpc.com/")
+        retry = adapter.max_retries
+        assert retry.total == 2
+        assert 503 in retry.status_forcelist
+        assert "POST" in retry.allowed_methods
+
+    def test_returns_empty_dict_when_retries_exhausted(self, fetcher: DataFetcher, http_mocks):
+        """When the session gives up (all retries failed), should return empty dict."""
+        http_mocks.post.side_effect = _TIMEOUT
         result = fetcher.get_token_info(TOKEN)
         assert result == {}
 
@@ -265,28 +283,47 @@ class TestRetryLogic:
 # ---------------------------------------------------------------------------
 
 class TestGetAllTokenData:
-    def test_returns_combined_dict(self, fetcher: DataFetcher, mocker):
-        mocker.patch.object(fetcher, "get_token_info", return_value={"name": "Test", "symbol": "TST"})
-        mocker.patch.object(fetcher, "get_token_largest_accounts", return_value=[{"address": "w1", "percentage": 10}])
-        mocker.patch.object(fetcher, "get_recent_transactions", return_value=[])
-        mocker.patch.object(fetcher, "get_rugcheck_report", return_value={"score": 100})
-
-        result = fetcher.get_all_token_data(TOKEN)
+    def test_returns_combined_dict(self, fetcher: DataFetcher):
+        with mock.patch.object(
+            fetcher,
+            "_helius_rpc_batch",
+            return_value=[_BATCH_ASSET_RESP, _BATCH_SUPPLY_RESP, _BATCH_LARGEST_RESP],
+        ), mock.patch.object(
+            fetcher, "get_recent_transactions", return_value=[]
+        ), mock.patch.object(
+            fetcher, "get_rugcheck_report", return_value={"score": 100}
+        ):
+            result = fetcher.get_all_token_data(TOKEN)
         assert result["token_info"]["name"] == "Test"
-        assert result["holders"] == [{"address": "w1", "percentage": 10}]
+        assert result["holders"][0]["address"] == "w1"
+        assert result["holders"][0]["percentage"] == pytest.approx(10.0)
         assert result["transactions"] == []
         assert result["rugcheck"]["score"] == 100
         assert result["token_address"] == TOKEN
 
+    def test_batch_responses_returned_in_call_order(self, fetcher: DataFetcher, http_mocks):
+        """Batch replies may arrive out of order; they are re-matched by id."""
+        http_mocks.post.return_value = _mock_resp(
+            [{"id": "1", "result": "b"}, {"id": "0", "result": "a"}]
+        )
+        out = fetcher._helius_rpc_batch([("methodA", []), ("methodB", [])])
+        assert out[0]["result"] == "a"
+        assert out[1]["result"] == "b"
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 class _MockResponse:
+    __slots__ = ("_content", "_frozen", "status_code")
+
     def __init__(self, data, status_code: int = 200):
-        self._data = data
         self.status_code = status_code
+        # Serialize once at construction: the fetcher parses .content on
+        # every call, and memoized instances are reused across tests.
+        self._content = json.dumps(data).encode()
+        self._frozen = MappingProxyType(data) if isinstance(data, dict) else data
 
     def raise_for_status(self):
         if self.status_code >= 400:
@@ -294,9 +331,40 @@ class _MockResponse:
             err.response = self
             raise err
 
+    @property
+    def content(self) -> bytes:
+        return self._content
+
     def json(self):
-        return self._data
+        return self._frozen
+
+
+# One _MockResponse per (payload, status) pair. Payloads are unhashable
+# dicts/lists, so the cache keys on identity; the extra list keeps a strong
+# reference to each payload so its id() stays valid for the module's lifetime.
+_RESP_CACHE: dict[tuple[int, int], _MockResponse] = {}
+_RESP_PAYLOADS: list = []
 
 
 def _mock_resp(data, status_code: int = 200) -> _MockResponse:
-    return _MockResponse(data, status_code)
+    key = (id(data), status_code)
+    cached = _RESP_CACHE.get(key)
+    if cached is None:
+        cached = _RESP_CACHE[key] = _MockResponse(data, status_code)
+        _RESP_PAYLOADS.append(data)
+    return cached
+
+
+# Pre-built error objects, reused as side_effect values instead of
+# constructing a fresh exception (and mock response) in every error test.
+_HTTP_404 = requests.exceptions.HTTPError(response=_MockResponse({}, 404))
+_CONN_ERR = requests.exceptions.ConnectionError("Network unreachable")
+_TIMEOUT = requests.exceptions.Timeout("always times out")
+
+# A 200 response whose body is not JSON (e.g. a captive-portal or proxy
+# error page); parsing it must not escape the fetcher's never-raise contract.
+_HTML_RESP = SimpleNamespace(
+    status_code=200,
+    content=b"<html><body>Sign in to the network</body></html>",
+    raise_for_status=lambda: None,
+)
@@ -4,6 +4,10 @@ Unit tests for RiskScorer.
 
 from __future__ import annotations
 
+import functools
+from collections.abc import Mapping
+from types import MappingProxyType
+
 import pytest
 
 from src.risk_scorer import RiskScorer
@@ -13,16 +17,36 @@ from src.risk_scorer import RiskScorer
 # Fixtures / helpers
 # ---------------------------------------------------------------------------
 
-def _safe_token(extra: dict | None = None) -> dict:
+# Canonical inputs, built once at import. The scorer never mutates its
+# arguments, so helpers can hand out these read-only views instead of
+# allocating fresh nested dicts for every test.
+_SAFE_TOKEN_BASE = MappingProxyType({
+    "mint_authority_revoked": True,
+    "freeze_authority_revoked": True,
+    "bot_percentage": 0.0,
+})
+
+_EMPTY_BUNDLE = MappingProxyType({
+    "bundled_wallet_percentage": 0.0,
+    "total_bundles": 0,
+    "suspicious_bundles": 0,
+    "bundle_groups": [],
+})
+
+_EMPTY_RUGCHECK = MappingProxyType({})
+
+
+@pytest.fixture(scope="module")
+def scorer() -> RiskScorer:
+    """One scorer for the whole module – it holds no per-call state."""
+    return RiskScorer()
+
+
+def _safe_token(extra: dict | None = None) -> Mapping:
     """Return a token_data dict representing a safe token."""
-    base = {
-        "mint_authority_revoked": True,
-        "freeze_authority_revoked": True,
-        "bot_percentage": 0.0,
-    }
     if extra:
-        base.update(extra)
-    return base
+        return {**_SAFE_TOKEN_BASE, **extra}
+    return _SAFE_TOKEN_BASE
 
 
 def _holders(percentages: list[float]) -> list[dict]:
@@ -30,12 +54,22 @@ def _holders(percentages: list[float]) -> list[dict]:
     return [{"address": f"wallet_{i}", "percentage": p} for i, p in enumerate(percentages)]
 
 
-def _empty_bundle() -> dict:
-    return {"bundled_wallet_percentage": 0.0, "total_bundles": 0, "suspicious_bundles": 0, "bundle_groups": []}
+@functools.lru_cache(maxsize=None)
+def _uniform_holders(pct: float, n: int) -> tuple[dict, ...]:
+    """``n`` holders each owning ``pct`` percent, built once per shape.
+
+    Nearly every test wants a flat distribution, so the common shapes are
+    cached; use _holders for mixed percentages.
+    """
+    return tuple({"address": f"wallet_{i}", "percentage": pct} for i in range(n))
+
 
+def _empty_bundle() -> Mapping:
+    return _EMPTY_BUNDLE
 
-def _empty_rugcheck() -> dict:
-    return {}
+
+def _empty_rugcheck() -> Mapping:
+    return _EMPTY_RUGCHECK
 
 
 # ---------------------------------------------------------------------------
@@ -43,11 +77,10 @@ def _empty_rugcheck() -> dict:
 # ---------------------------------------------------------------------------
 
 class TestMintAuthority:
-    def test_mint_not_revoked_adds_25_points(self):
-        scorer = RiskScorer()
+    def test_mint_not_revoked_adds_25_points(self, scorer: RiskScorer):
         result = scorer.score(
             _safe_token({"mint_authority_revoked": False}),
-            _holders([1.0] * 10),
+            _uniform_holders(1.0, 10),
             _empty_bundle(),
             _empty_rugcheck(),
         )
@@ -55,19 +88,17 @@ class TestMintAuthority:
         assert "mint_authority_not_revoked" in factor_names
         assert result["total_score"] >= 25
 
-    def test_mint_revoked_no_factor(self):
-        scorer = RiskScorer()
+    def test_mint_revoked_no_factor(self, scorer: RiskScorer):
         result = scorer.score(
             _safe_token({"mint_authority_revoked": True}),
-            _holders([1.0] * 10),
+            _uniform_holders(1.0, 10),
             _empty_bundle(),
             _empty_rugcheck(),
         )
         factor_names = [f["name"] for f in result["factors"]]
         assert "mint_authority_not_revoked" not in factor_names
 
-    def test_mint_not_revoked_flag_in_result(self):
-        scorer = RiskScorer()
+    def test_mint_not_revoked_flag_in_result(self, scorer: RiskScorer):
         result = scorer.score(
             _safe_token({"mint_authority_revoked": False}),
             [], _empty_bundle(), _empty_rugcheck(),
@@ -76,22 +107,20 @@ class TestMintAuthority:
 
 
 class TestFreezeAuthority:
-    def test_freeze_not_revoked_adds_20_points(self):
-        scorer = RiskScorer()
+    def test_freeze_not_revoked_adds_20_points(self, scorer: RiskScorer):
         result = scorer.score(
             _safe_token({"freeze_authority_revoked": False}),
-            _holders([1.0] * 10),
+            _uniform_holders(1.0, 10),
             _empty_bundle(),
             _empty_rugcheck(),
         )
         factor_names = [f["name"] for f in result["factors"]]
         assert "freeze_authority_not_revoked" in factor_names
 
-    def test_freeze_revoked_no_factor(self):
-        scorer = RiskScorer()
+    def test_freeze_revoked_no_factor(self, scorer: RiskScorer):
         result = scorer.score(
             _safe_token({"freeze_authority_revoked": True}),
-            _holders([1.0] * 10),
+            _uniform_holders(1.0, 10),
             _empty_bundle(),
             _empty_rugcheck(),
         )
@@ -99,107 +128,83 @@ class TestFreezeAuthority:
         assert "freeze_authority_not_revoked" not in factor_names
 
 
-class TestHolderConcentration:
-    def test_high_concentration_above_80_adds_20(self):
-        """Top 10 holders owning > 80% should add 20 points (high tier)."""
-        # 10 holders each with 9% = 90%
-        holders = _holders([9.0] * 10)
-        scorer = RiskScorer()
-        result = scorer.score(_safe_token(), holders, _empty_bundle(), _empty_rugcheck())
-        factor_names = [f["name"] for f in result["factors"]]
-        assert "top10_concentration_high" in factor_names
-        assert "top10_concentration_medium" not in factor_names
-
-    def test_medium_concentration_50_to_80_adds_10(self):
-        """Top 10 owning between 50% and 80% should add 10 points (medium tier)."""
-        # 10 holders each with 6% = 60%
-        holders = _holders([6.0] * 10)
-        scorer = RiskScorer()
-        result = scorer.score(_safe_token(), holders, _empty_bundle(), _empty_rugcheck())
-        factor_names = [f["name"] for f in result["factors"]]
-        assert "top10_concentration_medium" in factor_names
-        assert "top10_concentration_high" not in factor_names
-
-    def test_low_concentration_no_factor(self):
-        """Top 10 owning < 50% should not add concentration factor."""
-        holders = _holders([3.0] * 10)  # 30%
-        scorer = RiskScorer()
-        result = scorer.score(_safe_token(), holders, _empty_bundle(), _empty_rugcheck())
+class TestThresholdFactors:
+    """Data-driven checks for the threshold-gated factors.
+
+    Each row is one scenario: token_data overrides, holders, bundle and
+    rugcheck inputs, plus which factor names must (not) be triggered.
+    Mirrors the consolidated boundary table in TestRiskLevels.
+    """
+
+    @pytest.mark.parametrize("token_extra,holders,bundle,rugcheck,expect_present,expect_absent", [
+        # Holder concentration: >80% high tier, 50–80% medium tier, <50% neither.
+        (None, _uniform_holders(9.0, 10), _EMPTY_BUNDLE, _EMPTY_RUGCHECK,
+         ("top10_concentration_high",), ("top10_concentration_medium",)),
+        (None, _uniform_holders(6.0, 10), _EMPTY_BUNDLE, _EMPTY_RUGCHECK,
+         ("top10_concentration_medium",), ("top10_concentration_high",)),
+        (None, _uniform_holders(3.0, 10), _EMPTY_BUNDLE, _EMPTY_RUGCHECK,
+         (), ("top10_concentration_high", "top10_concentration_medium")),
+        # Bundler percentage: >30% triggers.
+        (None, [], {"bundled_wallet_percentage": 40.0, "total_bundles": 5, "suspicious_bundles": 3, "bundle_groups": []},
+         _EMPTY_RUGCHECK, ("bundler_percentage_high",), ()),
+        (None, [], {"bundled_wallet_percentage": 20.0, "total_bundles": 2, "suspicious_bundles": 0, "bundle_groups": []},
+         _EMPTY_RUGCHECK, (), ("bundler_percentage_high",)),
+        # Bot percentage: >50% triggers.
+        ({"bot_percentage": 60.0}, [], _EMPTY_BUNDLE, _EMPTY_RUGCHECK,
+         ("bot_percentage_high",), ()),
+        ({"bot_percentage": 30.0}, [], _EMPTY_BUNDLE, _EMPTY_RUGCHECK,
+         (), ("bot_percentage_high",)),
+        # RugCheck score: >500 triggers.
+        (None, [], _EMPTY_BUNDLE, {"score": 750, "markets": [{"id": "m1"}]},
+         ("rugcheck_high_risk",), ()),
+        (None, [], _EMPTY_BUNDLE, {"score": 200, "markets": [{"id": "m1"}]},
+         (), ("rugcheck_high_risk",)),
+    ], ids=[
+        "concentration-high", "concentration-medium", "concentration-low",
+        "bundler-high", "bundler-low",
+        "bots-high", "bots-low",
+        "rugcheck-high", "rugcheck-low",
+    ])
+    def test_factor_thresholds(
+        self, scorer: RiskScorer,
+        token_extra, holders, bundle, rugcheck, expect_present, expect_absent,
+    ):
+        result = scorer.score(_safe_token(token_extra), holders, bundle, rugcheck)
         factor_names = [f["name"] for f in result["factors"]]
-        assert "top10_concentration_high" not in factor_names
-        assert "top10_concentration_medium" not in factor_names
+        for name in expect_present:
+            assert name in factor_names
+        for name in expect_absent:
+            assert name not in factor_names
 
-    def test_top10_concentration_returned_in_result(self):
-        holders = _holders([9.0] * 10)
-        scorer = RiskScorer()
+    def test_top10_concentration_returned_in_result(self, scorer: RiskScorer):
+        holders = _uniform_holders(9.0, 10)
         result = scorer.score(_safe_token(), holders, _empty_bundle(), _empty_rugcheck())
         assert result["top10_concentration"] == pytest.approx(90.0)
 
 
-class TestBundlerPercentage:
-    def test_high_bundler_percentage_adds_15(self):
-        """bundled_wallet_percentage > 30% should add 15 points."""
-        bundle = {"bundled_wallet_percentage": 40.0, "total_bundles": 5, "suspicious_bundles": 3, "bundle_groups": []}
-        scorer = RiskScorer()
-        result = scorer.score(_safe_token(), [], bundle, _empty_rugcheck())
-        factor_names = [f["name"] for f in result["factors"]]
-        assert "bundler_percentage_high" in factor_names
-
-    def test_low_bundler_percentage_no_factor(self):
-        bundle = {"bundled_wallet_percentage": 20.0, "total_bundles": 2, "suspicious_bundles": 0, "bundle_groups": []}
-        scorer = RiskScorer()
-        result = scorer.score(_safe_token(), [], bundle, _empty_rugcheck())
-        factor_names = [f["name"] for f in result["factors"]]
-        assert "bundler_percentage_high" not in factor_names
-
-
-class TestBotPercentage:
-    def test_high_bot_percentage_adds_10(self):
-        scorer = RiskScorer()
-        result = scorer.score(
-            _safe_token({"bot_percentage": 60.0}),
-            [], _empty_bundle(), _empty_rugcheck(),
-        )
-        factor_names = [f["name"] for f in result["factors"]]
-        assert "bot_percentage_high" in factor_names
-
-    def test_low_bot_percentage_no_factor(self):
-        scorer = RiskScorer()
-        result = scorer.score(
-            _safe_token({"bot_percentage": 30.0}),
-            [], _empty_bundle(), _empty_rugcheck(),
-        )
-        factor_names = [f["name"] for f in result["factors"]]
-        assert "bot_percentage_high" not in factor_names
-
-
 class TestLiquidity:
-    def test_no_liquidity_info_adds_10(self):
-        scorer = RiskScorer()
+    def test_no_liquidity_info_adds_10(self, scorer: RiskScorer):
         result = scorer.score(_safe_token(), [], _empty_bundle(), {})
         factor_names = [f["name"] for f in result["factors"]]
         assert "no_liquidity_info" in factor_names
 
-    def test_has_liquidity_no_factor(self):
+    def test_has_liquidity_no_factor(self, scorer: RiskScorer):
         rugcheck = {"markets": [{"id": "market1"}]}
-        scorer = RiskScorer()
         result = scorer.score(_safe_token(), [], _empty_bundle(), rugcheck)
         factor_names = [f["name"] for f in result["factors"]]
         assert "no_liquidity_info" not in factor_names
 
 
 class TestRugcheckScore:
-    def test_rugcheck_high_score_adds_20(self):
+    def test_rugcheck_high_score_adds_20(self, scorer: RiskScorer):
         """RugCheck score > 500 should add 20 points."""
         rugcheck = {"score": 750, "markets": [{"id": "m1"}]}
-        scorer = RiskScorer()
         result = scorer.score(_safe_token(), [], _empty_bundle(), rugcheck)
         factor_names = [f["name"] for f in result["factors"]]
         assert "rugcheck_high_risk" in factor_names
 
-    def test_rugcheck_low_score_no_factor(self):
+    def test_rugcheck_low_score_no_factor(self, scorer: RiskScorer):
         rugcheck = {"score": 200, "markets": [{"id": "m1"}]}
-        scorer = RiskScorer()
         result = scorer.score(_safe_token(), [], _empty_bundle(), rugcheck)
         factor_names = [f["name"] for f in result["factors"]]
         assert "rugcheck_high_risk" not in factor_names
@@ -210,15 +215,14 @@ class TestRugcheckScore:
 # ---------------------------------------------------------------------------
 
 class TestCombinedFactors:
-    def test_multiple_factors_accumulate(self):
+    def test_multiple_factors_accumulate(self, scorer: RiskScorer):
         """Score should be sum of all triggered factors."""
         # mint NOT revoked (+25) + freeze NOT revoked (+20) = 45
         token = {"mint_authority_revoked": False, "freeze_authority_revoked": False, "bot_percentage": 0}
-        scorer = RiskScorer()
         result = scorer.score(token, [], _empty_bundle(), _empty_rugcheck())
         assert result["total_score"] >= 45
 
-    def test_score_capped_at_100(self):
+    def test_score_capped_at_100(self, scorer: RiskScorer):
         """Score must never exceed 100 regardless of how many factors trigger."""
         # Trigger everything possible
         token = {
@@ -226,20 +230,18 @@ class TestCombinedFactors:
             "freeze_authority_revoked": False,  # +20
             "bot_percentage": 80.0,            # +10
         }
-        holders = _holders([9.0] * 10)         # +20 high concentration
+        holders = _uniform_holders(9.0, 10)         # +20 high concentration
         bundle = {"bundled_wallet_percentage": 50.0, "total_bundles": 5, "suspicious_bundles": 5, "bundle_groups": []}  # +15
         rugcheck = {"score": 900}              # +20 rugcheck; no markets → +10 no_liquidity
-        scorer = RiskScorer()
         result = scorer.score(token, holders, bundle, rugcheck)
         assert result["total_score"] <= 100
 
-    def test_perfectly_safe_token_scores_zero(self):
+    def test_perfectly_safe_token_scores_zero(self, scorer: RiskScorer):
         """A fully safe token with liquidity should score 0."""
         token = {"mint_authority_revoked": True, "freeze_authority_revoked": True, "bot_percentage": 0}
-        holders = _holders([2.0] * 10)  # 20% concentration
+        holders = _uniform_holders(2.0, 10)  # 20% concentration
         bundle = _empty_bundle()
         rugcheck = {"score": 100, "markets": [{"id": "m1"}]}
-        scorer = RiskScorer()
         result = scorer.score(token, holders, bundle, rugcheck)
         assert result["total_score"] == 0
         assert result["risk_level"] == "LOW"
@@ -260,12 +262,10 @@ class TestRiskLevels:
         (75, "CRITICAL"),
         (100, "CRITICAL"),
     ])
-    def test_risk_level_boundaries(self, score: int, expected: str):
-        scorer = RiskScorer()
+    def test_risk_level_boundaries(self, scorer: RiskScorer, score: int, expected: str):
         assert scorer._get_risk_level(score) == expected
 
-    def test_risk_level_in_result(self):
-        scorer = RiskScorer()
+    def test_risk_level_in_result(self, scorer: RiskScorer):
         result = scorer.score(
             {"mint_authority_revoked": False, "freeze_authority_revoked": False, "bot_percentage": 0},
             [], _empty_bundle(), _empty_rugcheck(),
@@ -278,8 +278,7 @@ class TestRiskLevels:
 # ---------------------------------------------------------------------------
 
 class TestResultStructure:
-    def test_result_contains_required_keys(self):
-        scorer = RiskScorer()
+    def test_result_contains_required_keys(self, scorer: RiskScorer):
         result = scorer.score(_safe_token(), [], _empty_bundle(), _empty_rugcheck())
         for key in (
             "total_score", "risk_level", "factors",
@@ -288,8 +287,7 @@ class TestResultStructure:
         ):
             assert key in result, f"Missing key: {key}"
 
-    def test_factors_have_required_keys(self):
-        scorer = RiskScorer()
+    def test_factors_have_required_keys(self, scorer: RiskScorer):
         result = scorer.score(
             _safe_token({"mint_authority_revoked": False}),
             [], _empty_bundle(), _empty_rugcheck(),
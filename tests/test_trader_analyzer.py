@@ -4,7 +4,8 @@ Unit tests for TraderAnalyzer.
 
 from __future__ import annotations
 
-import time
+import itertools
+
 import pytest
 
 from src.trader_analyzer import TraderAnalyzer
@@ -14,6 +15,17 @@ from src.trader_analyzer import TraderAnalyzer
 # Fixtures / helpers
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(scope="module")
+def analyzer() -> TraderAnalyzer:
+    """One analyzer for the whole module – it holds no per-call state."""
+    return TraderAnalyzer()
+
+
+# Default timestamps come from a counter rather than time.time(): no
+# syscall per helper call, and the values are deterministic across runs.
+_FAKE_TS = itertools.count(1_700_000_000)
+
+
 def _make_txn(
     fee_payer: str = "wallet_A",
     timestamp: float | None = None,
@@ -23,7 +35,7 @@ def _make_txn(
     amount: float = 100.0,
 ) -> dict:
     """Build a minimal mock transaction dict."""
-    ts = timestamp if timestamp is not None else time.time()
+    ts = timestamp if timestamp is not None else float(next(_FAKE_TS))
     to_acct = fee_payer if direction == "buy" else ""
     from_acct = "" if direction == "buy" else fee_payer
     return {
@@ -42,13 +54,46 @@ def _make_txn(
     }
 
 
+def _make_txn_bulk(
+    wallet: str,
+    timestamps: list[float],
+    slot_base: int,
+    direction: str = "buy",
+    amount: float = 100.0,
+) -> list[dict]:
+    """Build many transactions for one wallet in one list comprehension.
+
+    Fast path for the large workloads: hoists the direction branches out
+    of the loop and skips the per-call overhead of _make_txn, which stays
+    for one-off cases.
+    """
+    to_acct = wallet if direction == "buy" else ""
+    from_acct = "" if direction == "buy" else wallet
+    return [
+        {
+            "signature": f"sig_{wallet}_{i}",
+            "feePayer": wallet,
+            "timestamp": ts,
+            "slot": slot_base + i,
+            "tokenTransfers": [
+                {
+                    "mint": "mint123",
+                    "tokenAmount": amount,
+                    "toUserAccount": to_acct,
+                    "fromUserAccount": from_acct,
+                }
+            ],
+        }
+        for i, ts in enumerate(timestamps)
+    ]
+
+
 def _make_high_freq_txns(wallet: str, count: int = 10, interval_secs: float = 5.0) -> list[dict]:
     """Create high-frequency transactions spaced `interval_secs` apart."""
     base_ts = 1_700_000_000.0
-    return [
-        _make_txn(fee_payer=wallet, timestamp=base_ts + i * interval_secs, slot=200 + i)
-        for i in range(count)
-    ]
+    return _make_txn_bulk(
+        wallet, [base_ts + i * interval_secs for i in range(count)], slot_base=200
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -56,42 +101,38 @@ def _make_high_freq_txns(wallet: str, count: int = 10, interval_secs: float = 5.
 # ---------------------------------------------------------------------------
 
 class TestBotDetection:
-    def test_bot_detected_high_frequency(self):
+    def test_bot_detected_high_frequency(self, analyzer: TraderAnalyzer):
         """Wallet with >5 txns and avg interval <30s should be flagged as bot."""
         txns = _make_high_freq_txns("bot_wallet", count=10, interval_secs=5)
-        analyzer = TraderAnalyzer()
         result = analyzer.analyze(txns, [])
-        detail = next(d for d in result["trader_details"] if d["wallet"] == "bot_wallet")
+        detail = result["trader_details_by_wallet"]["bot_wallet"]
         assert detail["is_bot"] is True
         assert detail["label"] == "bot"
 
-    def test_bot_not_flagged_low_frequency(self):
+    def test_bot_not_flagged_low_frequency(self, analyzer: TraderAnalyzer):
         """Wallet with adequate spacing between txns should NOT be flagged as bot."""
         base_ts = 1_700_000_000.0
         txns = [
             _make_txn(fee_payer="real_wallet", timestamp=base_ts + i * 120, slot=300 + i)
             for i in range(8)
         ]
-        analyzer = TraderAnalyzer()
         result = analyzer.analyze(txns, [])
-        detail = next(d for d in result["trader_details"] if d["wallet"] == "real_wallet")
+        detail = result["trader_details_by_wallet"]["real_wallet"]
         assert detail["is_bot"] is False
 
-    def test_bot_not_flagged_too_few_txns(self):
+    def test_bot_not_flagged_too_few_txns(self, analyzer: TraderAnalyzer):
         """Wallet with <= BOT_MIN_TXNS transactions should never be flagged as bot."""
         txns = _make_high_freq_txns("small_wallet", count=3, interval_secs=1)
-        analyzer = TraderAnalyzer()
         result = analyzer.analyze(txns, [])
-        detail = next(d for d in result["trader_details"] if d["wallet"] == "small_wallet")
+        detail = result["trader_details_by_wallet"]["small_wallet"]
         assert detail["is_bot"] is False
 
-    def test_bot_percentage_calculated_correctly(self):
+    def test_bot_percentage_calculated_correctly(self, analyzer: TraderAnalyzer):
         bot_txns = _make_high_freq_txns("bot1", count=10, interval_secs=2)
         real_txns = [
             _make_txn("real1", timestamp=1_700_000_000.0 + i * 200, slot=500 + i)
             for i in range(8)
         ]
-        analyzer = TraderAnalyzer()
         result = analyzer.analyze(bot_txns + real_txns, [])
         # 1 bot out of 2 wallets = 50%
         assert result["bot_percentage"] == 50.0
@@ -103,7 +144,7 @@ class TestBotDetection:
 # ---------------------------------------------------------------------------
 
 class TestWashTraderDetection:
-    def test_wash_trader_detected(self):
+    def test_wash_trader_detected(self, analyzer: TraderAnalyzer):
         """Wallet with 2+ buy→sell cycles within 1 hour should be a wash trader."""
         base = 1_700_000_000.0
         txns = []
@@ -113,25 +154,23 @@ class TestWashTraderDetection:
             txns.append(_make_txn("wash_wallet", timestamp=base + offset, direction="buy"))
             txns.append(_make_txn("wash_wallet", timestamp=base + offset + 600, direction="sell"))
 
-        analyzer = TraderAnalyzer()
         result = analyzer.analyze(txns, [])
-        detail = next(d for d in result["trader_details"] if d["wallet"] == "wash_wallet")
+        detail = result["trader_details_by_wallet"]["wash_wallet"]
         assert detail["is_wash_trader"] is True
         assert detail["label"] == "wash_trader"
 
-    def test_wash_trader_not_flagged_single_cycle(self):
+    def test_wash_trader_not_flagged_single_cycle(self, analyzer: TraderAnalyzer):
         """Single buy→sell should not be flagged."""
         base = 1_700_000_000.0
         txns = [
             _make_txn("trader", timestamp=base, direction="buy"),
             _make_txn("trader", timestamp=base + 300, direction="sell"),
         ]
-        analyzer = TraderAnalyzer()
         result = analyzer.analyze(txns, [])
-        detail = next(d for d in result["trader_details"] if d["wallet"] == "trader")
+        detail = result["trader_details_by_wallet"]["trader"]
         assert detail["is_wash_trader"] is False
 
-    def test_wash_trader_outside_window_not_flagged(self):
+    def test_wash_trader_outside_window_not_flagged(self, analyzer: TraderAnalyzer):
         """Cycles outside the wash window (>1 hr apart) should NOT be flagged."""
         base = 1_700_000_000.0
         txns = []
@@ -140,9 +179,8 @@ class TestWashTraderDetection:
             offset = cycle * 7200  # 2 hours between cycles
             txns.append(_make_txn("long_holder", timestamp=base + offset, direction="buy"))
             txns.append(_make_txn("long_holder", timestamp=base + offset + 4000, direction="sell"))
-        analyzer = TraderAnalyzer()
         result = analyzer.analyze(txns, [])
-        detail = next(d for d in result["trader_details"] if d["wallet"] == "long_holder")
+        detail = result["trader_details_by_wallet"]["long_holder"]
         assert detail["is_wash_trader"] is False
 
 
@@ -157,32 +195,29 @@ class TestSybilDetection:
             for w in wallets
         ]
 
-    def test_sybil_detected_large_cluster_same_amounts(self):
+    def test_sybil_detected_large_cluster_same_amounts(self, analyzer: TraderAnalyzer):
         """5 wallets in same slot with identical amounts should trigger sybil for each."""
         wallets = [f"wallet_{i}" for i in range(5)]
         txns = self._make_cluster(slot=42, wallets=wallets, amount=100.0)
-        analyzer = TraderAnalyzer()
         result = analyzer.analyze(txns, [])
         # At least some should be flagged (cluster size = 4 others per wallet >= SYBIL_CLUSTER_SIZE=3)
         sybil_details = [d for d in result["trader_details"] if d["is_sybil"]]
         assert len(sybil_details) > 0
 
-    def test_sybil_not_flagged_small_cluster(self):
+    def test_sybil_not_flagged_small_cluster(self, analyzer: TraderAnalyzer):
         """2 wallets in same slot is too small to trigger sybil."""
         txns = self._make_cluster(slot=99, wallets=["w1", "w2"], amount=100.0)
-        analyzer = TraderAnalyzer()
         result = analyzer.analyze(txns, [])
         for detail in result["trader_details"]:
             assert detail["is_sybil"] is False
 
-    def test_sybil_not_flagged_varied_amounts(self):
+    def test_sybil_not_flagged_varied_amounts(self, analyzer: TraderAnalyzer):
         """Large cluster with varied amounts should NOT be sybil."""
         base_ts = 1_700_000_000.0
         txns = [
             _make_txn(f"wallet_{i}", timestamp=base_ts, slot=50, amount=float(i * 37 + 1))
             for i in range(5)
         ]
-        analyzer = TraderAnalyzer()
         result = analyzer.analyze(txns, [])
         # With varied amounts, sybil flag should be False
         for d in result["trader_details"]:
@@ -194,16 +229,15 @@ class TestSybilDetection:
 # ---------------------------------------------------------------------------
 
 class TestRealTraderClassification:
-    def test_real_trader_normal_activity(self):
+    def test_real_trader_normal_activity(self, analyzer: TraderAnalyzer):
         """Normal wallet with moderate spacing should be classified as real."""
         base = 1_700_000_000.0
         txns = [
             _make_txn("normal_guy", timestamp=base + i * 3600, slot=1000 + i)
             for i in range(4)
         ]
-        analyzer = TraderAnalyzer()
         result = analyzer.analyze(txns, [])
-        detail = next(d for d in result["trader_details"] if d["wallet"] == "normal_guy")
+        detail = result["trader_details_by_wallet"]["normal_guy"]
         assert detail["label"] == "real"
         assert result["real_traders"] >= 1
 
@@ -213,33 +247,29 @@ class TestRealTraderClassification:
 # ---------------------------------------------------------------------------
 
 class TestEdgeCases:
-    def test_empty_transactions(self):
+    def test_empty_transactions(self, analyzer: TraderAnalyzer):
         """Empty transaction list should return sensible zero defaults."""
-        analyzer = TraderAnalyzer()
         result = analyzer.analyze([], [])
         assert result["total_wallets"] == 0
         assert result["bots"] == 0
         assert result["bot_percentage"] == 0.0
         assert result["trader_details"] == []
 
-    def test_single_transaction(self):
+    def test_single_transaction(self, analyzer: TraderAnalyzer):
         """Single transaction should not crash and classify the wallet."""
         txns = [_make_txn("lone_wallet")]
-        analyzer = TraderAnalyzer()
         result = analyzer.analyze(txns, [])
         assert result["total_wallets"] == 1
         assert len(result["trader_details"]) == 1
 
-    def test_transactions_without_timestamps(self):
+    def test_transactions_without_timestamps(self, analyzer: TraderAnalyzer):
         """Transactions missing timestamp field should not cause crashes."""
         txns = [{"feePayer": "wallet_notimestamp", "slot": 10, "tokenTransfers": []}]
-        analyzer = TraderAnalyzer()
         result = analyzer.analyze(txns, [])
         assert result["total_wallets"] == 1
 
-    def test_returns_expected_keys(self):
+    def test_returns_expected_keys(self, analyzer: TraderAnalyzer):
         """Result dict must always contain all expected keys."""
-        analyzer = TraderAnalyzer()
         result = analyzer.analyze([], [])
         for key in ("total_wallets", "real_traders", "bots", "wash_traders",
                     "sybil_wallets", "trader_details", "bot_percentage"):
@@ -12,55 +12,143 @@ Usage:
 
 from __future__ import annotations
 
-import argparse
+import re
 import sys
+from types import SimpleNamespace
 
+# Compiled once: strips [tag]/[/tag] rich markup for plain output.
+_RICH_MARKUP_RE = re.compile(r"\[/?[^\]]*\]")
 
-def _build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(
-        prog="token_check",
-        description="Solana Token Guardian – analyse a token for rug-pull and manipulation risks.",
-    )
-    parser.add_argument("token_address", help="Solana token mint address to analyse")
-    parser.add_argument(
-        "--output-dir",
-        default=None,
-        metavar="DIR",
-        help="Override the output directory for reports and charts (default: from .env or ./output)",
-    )
-    parser.add_argument(
-        "--no-charts",
-        action="store_true",
-        help="Skip chart generation (faster, no matplotlib dependency at runtime)",
-    )
-    parser.add_argument(
-        "--json-only",
-        action="store_true",
-        help="Only write JSON report; skip HTML report and terminal dashboard",
-    )
-    parser.add_argument(
-        "--html",
-        action="store_true",
-        help="Generate HTML report (in addition to or instead of other outputs)",
+# rich's print, resolved on first use: None = untried, False = unavailable.
+_RPRINT = None
+
+_USAGE = "usage: token_check [-h] [--output-dir DIR] [--no-charts] [--json-only] [--html] token_address"
+
+_HELP = f"""{_USAGE}
+
+Solana Token Guardian – analyse a token for rug-pull and manipulation risks.
+
+positional arguments:
+  token_address     Solana token mint address to analyse
+
+options:
+  -h, --help        show this help message and exit
+  --output-dir DIR  Override the output directory for reports and charts
+                    (default: from .env or ./output)
+  --no-charts       Skip chart generation (faster, no matplotlib dependency
+                    at runtime)
+  --json-only       Only write JSON report; skip HTML report and terminal
+                    dashboard
+  --html            Generate HTML report (in addition to or instead of other
+                    outputs)
+"""
+
+
+def _parse_error(msg: str) -> None:
+    print(_USAGE, file=sys.stderr)
+    print(f"token_check: error: {msg}", file=sys.stderr)
+    raise SystemExit(2)
+
+
+def _parse_argv(argv: list[str]) -> SimpleNamespace:
+    """Hand-rolled parser for the handful of CLI flags.
+
+    argparse drags in gettext/textwrap and builds per-action objects just
+    to recognise four options; a plain loop keeps cold start lean. Exit
+    codes and the usage/help shape mirror what argparse produced.
+    """
+    args = SimpleNamespace(
+        token_address=None, output_dir=None, no_charts=False, json_only=False, html=False
     )
-    return parser
+    it = iter(argv)
+    for arg in it:
+        if arg in ("-h", "--help"):
+            print(_HELP, end="")
+            raise SystemExit(0)
+        elif arg == "--output-dir":
+            args.output_dir = next(it, None)
+            if args.output_dir is None:
+                _parse_error("argument --output-dir: expected one argument")
+        elif arg.startswith("--output-dir="):
+            args.output_dir = arg.partition("=")[2]
+        elif arg == "--no-charts":
+            args.no_charts = True
+        elif arg == "--json-only":
+            args.json_only = True
+        elif arg == "--html":
+            args.html = True
+        elif arg.startswith("-") and arg != "-":
+            _parse_error(f"unrecognized arguments: {arg}")
+        elif args.token_address is None:
+            args.token_address = arg
+        else:
+            _parse_error(f"unrecognized arguments: {arg}")
+    if args.token_address is None:
+        _parse_error("the following arguments are required: token_address")
+    return args
 
 
 def _console_print(msg: str, style: str = "") -> None:
     """Print using rich if available, otherwise plain print."""
-    try:
-        from rich import print as rprint
-        rprint(msg)
-    except ImportError:
-        # Strip basic rich markup for plain output
-        import re
-        plain = re.sub(r"\[/?[^\]]*\]", "", msg)
-        print(plain)
+    global _RPRINT
+    if _RPRINT is None:
+        try:
+            from rich import print as rprint
+            _RPRINT = rprint
+        except ImportError:
+            _RPRINT = False
+    if _RPRINT:
+        _RPRINT(msg)
+    else:
+        print(_RICH_MARKUP_RE.sub("", msg))
+
+
+def _emit_empty_report(
+    output_dir: str, token_address: str, token_info: dict, risk_result: dict
+) -> str:
+    """Write a minimal JSON report for a token with no on-chain data.
+
+    The --json-only dead-token fast path skips the analyzers, charts and
+    ReportGenerator, so this helper imports only the stdlib and mirrors
+    the report shape and filename convention used by ReportGenerator.
+    """
+    import json
+    from datetime import datetime, timezone
+    from pathlib import Path
+
+    out_dir = Path(output_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    now = datetime.now(tz=timezone.utc)
+    report = {
+        "generated_at": now.isoformat(),
+        "token_address": token_address,
+        "token_info": token_info,
+        "risk": risk_result,
+        "trader_analysis": {
+            "total_wallets": 0,
+            "real_traders": 0,
+            "bots": 0,
+            "wash_traders": 0,
+            "sybil_wallets": 0,
+            "bot_percentage": 0.0,
+        },
+        "bundle_analysis": {
+            "total_bundles": 0,
+            "suspicious_bundles": 0,
+            "bundled_wallet_percentage": 0.0,
+        },
+        "bundle_groups_preview": [],
+        "chart_files": [],
+        "note": "No transactions or holders found on-chain; trader and bundle analysis skipped.",
+    }
+    out_path = out_dir / f"report_{token_address[:8]}_{now.strftime('%Y%m%d_%H%M%S')}.json"
+    with out_path.open("w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2, default=str)
+    return str(out_path)
 
 
 def main(argv: list[str] | None = None) -> int:
-    parser = _build_parser()
-    args = parser.parse_args(argv)
+    args = _parse_argv(sys.argv[1:] if argv is None else argv)
 
     token_address = args.token_address.strip()
 
@@ -86,15 +174,41 @@ def main(argv: list[str] | None = None) -> int:
     transactions: list = all_data.get("transactions", [])
     rugcheck: dict = all_data.get("rugcheck", {})
 
-    # ── Trader analysis ──────────────────────────────────────────────────
-    _console_print("[cyan]→ Analysing trader behaviour...[/cyan]")
-    from src.trader_analyzer import TraderAnalyzer
-    trader_analysis = TraderAnalyzer().analyze(transactions, holders)
+    # ── Dead-token fast path (--json-only) ───────────────────────────────
+    # No transactions or holders means nothing for the trader or bundle
+    # analysis to chew on; when only the JSON report was asked for, skip
+    # the analyzers, charts and report machinery (and their imports) and
+    # emit a minimal report. Risk scoring still runs: mint/freeze
+    # authority and liquidity apply to a dead token too.
+    if args.json_only and not transactions and not holders:
+        _console_print("[yellow]No on-chain activity or holders found for this token.[/yellow]")
+        from src.risk_scorer import RiskScorer
+        risk_result = RiskScorer().score(
+            {**token_info, "bot_percentage": 0.0}, holders, {}, rugcheck
+        )
+        json_path = _emit_empty_report(output_dir, token_address, token_info, risk_result)
+        _console_print(f"\n[green]✓ JSON report:[/green] {json_path}")
+        if risk_result.get("risk_level", "LOW") == "CRITICAL":
+            _console_print(
+                "\n[bold white on red] ⛔  CRITICAL RISK – exercise extreme caution [/bold white on red]\n"
+            )
+            return 1
+        return 0
+
+    # ── Trader analysis + bundle detection ───────────────────────────────
+    # Independent passes over the same transaction list; both classes are
+    # stateless, so they run concurrently on two threads.
+    _console_print("[cyan]→ Analysing trader behaviour and wallet bundles...[/cyan]")
+    from concurrent.futures import ThreadPoolExecutor
 
-    # ── Bundle detection ─────────────────────────────────────────────────
-    _console_print("[cyan]→ Detecting wallet bundles...[/cyan]")
     from src.bundler_detector import BundlerDetector
-    bundle_analysis = BundlerDetector().detect(transactions)
+    from src.trader_analyzer import TraderAnalyzer
+
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        trader_future = ex.submit(TraderAnalyzer().analyze, transactions, holders)
+        bundle_future = ex.submit(BundlerDetector().detect, transactions)
+        trader_analysis = trader_future.result()
+        bundle_analysis = bundle_future.result()
 
     # ── Risk scoring ─────────────────────────────────────────────────────
     _console_print("[cyan]→ Computing risk score...[/cyan]")